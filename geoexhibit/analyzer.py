@@ -7,7 +7,7 @@ from typing import Dict, Any, List, Optional
 from .timespan import TimeSpan
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetSpec:
     """Specification for a STAC asset."""
 
@@ -20,7 +20,7 @@ class AssetSpec:
     extra_fields: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzerOutput:
     """Output from an analyzer for a single feature/time combination."""
 
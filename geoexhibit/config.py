@@ -1,9 +1,63 @@
 """Configuration management for GeoExhibit."""
 
-import json
+import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, cast
+
+import orjson
+
+_REQUIRED_SECTIONS = frozenset({"project", "aws", "map", "stac", "ids", "time"})
+_REQUIRED_PROJECT_FIELDS = frozenset({"name", "collection_id", "title", "description"})
+_VALID_TIME_MODES = frozenset({"declarative", "callable"})
+_VALID_EXTRACTORS = frozenset(
+    {
+        "attribute_date",
+        "attribute_interval",
+        "fixed_annual_dates",
+        "from_epoch",
+        "regex_from_string",
+    }
+)
+_EXTRACTORS_REQUIRING_FIELD = frozenset(
+    {"attribute_date", "attribute_interval", "regex_from_string"}
+)
+_VALID_CHECKSUM_ALGORITHMS = frozenset(
+    {"CRC32", "CRC32C", "CRC64NVME", "SHA1", "SHA256"}
+)
+# botocore only computes these with the AWS CRT installed (geoexhibit[crt])
+_CRT_CHECKSUM_ALGORITHMS = frozenset({"CRC32C", "CRC64NVME"})
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "project": {
+        "name": "my-geoexhibit-project",
+        "collection_id": "my_collection",
+        "title": "My GeoExhibit Collection",
+        "description": "A collection of geospatial analyses",
+    },
+    "aws": {"s3_bucket": "your-bucket-name", "region": "ap-southeast-2"},
+    "map": {
+        "pmtiles": {
+            "feature_id_property": "feature_id",
+            "minzoom": 5,
+            "maxzoom": 14,
+        },
+        "base_url": "",
+    },
+    "stac": {
+        "use_extensions": ["proj", "raster", "processing"],
+        "geometry_in_item": True,
+    },
+    "ids": {"strategy": "ulid", "prefix": ""},
+    "time": {
+        "mode": "declarative",
+        "extractor": "attribute_date",
+        "field": "properties.fire_date",
+        "format": "auto",
+        "tz": "UTC",
+    },
+    "analyzer": {"name": "demo"},
+}
 
 
 @dataclass
@@ -21,9 +75,7 @@ class GeoExhibitConfig:
     @property
     def s3_bucket(self) -> str:
         """Get S3 bucket name."""
-        bucket = self.aws["s3_bucket"]
-        assert isinstance(bucket, str)
-        return bucket
+        return cast(str, self.aws["s3_bucket"])
 
     @property
     def aws_region(self) -> Optional[str]:
@@ -31,26 +83,35 @@ class GeoExhibitConfig:
         region = self.aws.get("region")
         return region if region is None or isinstance(region, str) else None
 
+    @property
+    def upload_concurrency(self) -> int:
+        """Get maximum number of concurrent S3 uploads."""
+        return cast(int, self.aws.get("upload_concurrency", 16))
+
+    @property
+    def skip_unchanged_uploads(self) -> bool:
+        """Whether to skip uploading files already in S3 with the same content."""
+        return cast(bool, self.aws.get("skip_unchanged", False))
+
+    @property
+    def checksum_algorithm(self) -> Optional[str]:
+        """Get S3 upload checksum algorithm (optional, e.g. CRC32C)."""
+        return cast(Optional[str], self.aws.get("checksum_algorithm"))
+
     @property
     def collection_id(self) -> str:
         """Get collection ID."""
-        collection_id = self.project["collection_id"]
-        assert isinstance(collection_id, str)
-        return collection_id
+        return cast(str, self.project["collection_id"])
 
     @property
     def project_name(self) -> str:
         """Get project name."""
-        name = self.project["name"]
-        assert isinstance(name, str)
-        return name
+        return cast(str, self.project["name"])
 
     @property
     def use_extensions(self) -> List[str]:
         """Get STAC extensions to use."""
-        extensions = self.stac.get("use_extensions", [])
-        assert isinstance(extensions, list)
-        return extensions
+        return cast(List[str], self.stac.get("use_extensions", []))
 
     @property
     def time_config(self) -> Dict[str, Any]:
@@ -60,9 +121,12 @@ class GeoExhibitConfig:
     @property
     def analyzer_name(self) -> str:
         """Get analyzer name."""
-        name = self.analyzer.get("name", "demo")
-        assert isinstance(name, str)
-        return name
+        return cast(str, self.analyzer.get("name", "demo"))
+
+    @property
+    def analyzer_concurrency(self) -> int:
+        """Get maximum number of analyzer calls run in parallel."""
+        return cast(int, self.analyzer.get("concurrency", 1))
 
     @property
     def analyzer_config(self) -> Dict[str, Any]:
@@ -75,18 +139,19 @@ def load_config(config_path: Path) -> GeoExhibitConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        data = json.load(f)
+    data = orjson.loads(config_path.read_bytes())
 
     return validate_config(data)
 
 
 def validate_config(data: Dict[str, Any]) -> GeoExhibitConfig:
     """Validate configuration data and return GeoExhibitConfig instance."""
-    required_sections = ["project", "aws", "map", "stac", "ids", "time"]
-    for section in required_sections:
-        if section not in data:
-            raise ValueError(f"Missing required configuration section: {section}")
+    missing_sections = _REQUIRED_SECTIONS - data.keys()
+    if missing_sections:
+        raise ValueError(
+            "Missing required configuration section: "
+            f"{', '.join(sorted(missing_sections))}"
+        )
 
     # Analyzer section is optional, defaults to demo analyzer
     if "analyzer" not in data:
@@ -112,22 +177,61 @@ def validate_config(data: Dict[str, Any]) -> GeoExhibitConfig:
 
 def _validate_project_section(project: Dict[str, Any]) -> None:
     """Validate project configuration section."""
-    required_fields = ["name", "collection_id", "title", "description"]
-    for field in required_fields:
-        if field not in project:
-            raise ValueError(f"Missing required project field: {field}")
+    missing_fields = _REQUIRED_PROJECT_FIELDS - project.keys()
+    if missing_fields:
+        raise ValueError(
+            f"Missing required project field: {', '.join(sorted(missing_fields))}"
+        )
+
+    for field in ("name", "collection_id"):
+        if not isinstance(project[field], str):
+            raise ValueError(f"Project field {field} must be a string")
 
 
 def _validate_aws_section(aws: Dict[str, Any]) -> None:
     """Validate AWS configuration section."""
     if "s3_bucket" not in aws:
         raise ValueError("Missing required AWS field: s3_bucket")
+    if not isinstance(aws["s3_bucket"], str):
+        raise ValueError("AWS s3_bucket must be a string")
+
+    concurrency = aws.get("upload_concurrency", 16)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool):
+        raise ValueError("AWS upload_concurrency must be an integer")
+    if concurrency < 1:
+        raise ValueError("AWS upload_concurrency must be at least 1")
+
+    if not isinstance(aws.get("skip_unchanged", False), bool):
+        raise ValueError("AWS skip_unchanged must be a boolean")
+
+    checksum_algorithm = aws.get("checksum_algorithm")
+    if (
+        checksum_algorithm is not None
+        and checksum_algorithm not in _VALID_CHECKSUM_ALGORITHMS
+    ):
+        raise ValueError(
+            f"Invalid AWS checksum_algorithm: {checksum_algorithm}. "
+            f"Must be one of: {sorted(_VALID_CHECKSUM_ALGORITHMS)}"
+        )
+    if checksum_algorithm in _CRT_CHECKSUM_ALGORITHMS:
+        from botocore import compat as botocore_compat
+
+        if not botocore_compat.HAS_CRT:
+            raise ValueError(
+                f"AWS checksum_algorithm {checksum_algorithm} requires the AWS CRT "
+                f"(pip install 'geoexhibit[crt]'); use CRC32, SHA1 or SHA256 "
+                f"without it"
+            )
 
 
 def _validate_stac_section(stac: Dict[str, Any]) -> None:
     """Validate STAC configuration section and set defaults."""
     if "use_extensions" not in stac:
         stac["use_extensions"] = ["proj", "raster", "processing"]
+    if not isinstance(stac["use_extensions"], list) or not all(
+        isinstance(ext, str) for ext in stac["use_extensions"]
+    ):
+        raise ValueError("STAC use_extensions must be a list of strings")
     if "geometry_in_item" not in stac:
         stac["geometry_in_item"] = True
 
@@ -143,7 +247,7 @@ def _validate_time_section(time: Dict[str, Any]) -> None:
     if "mode" not in time:
         raise ValueError("Missing required time field: mode")
 
-    if time["mode"] not in ["declarative", "callable"]:
+    if time["mode"] not in _VALID_TIME_MODES:
         raise ValueError("time.mode must be 'declarative' or 'callable'")
 
     if time["mode"] == "declarative":
@@ -162,23 +266,13 @@ def _validate_declarative_time_config(time: Dict[str, Any]) -> None:
     if "extractor" not in time:
         raise ValueError("Declarative time mode requires 'extractor' field")
 
-    valid_extractors = [
-        "attribute_date",
-        "attribute_interval",
-        "fixed_annual_dates",
-        "from_epoch",
-        "regex_from_string",
-    ]
-    if time["extractor"] not in valid_extractors:
+    if time["extractor"] not in _VALID_EXTRACTORS:
         raise ValueError(
-            f"Invalid extractor: {time['extractor']}. Must be one of: {valid_extractors}"
+            f"Invalid extractor: {time['extractor']}. "
+            f"Must be one of: {sorted(_VALID_EXTRACTORS)}"
         )
 
-    if time["extractor"] in [
-        "attribute_date",
-        "attribute_interval",
-        "regex_from_string",
-    ]:
+    if time["extractor"] in _EXTRACTORS_REQUIRING_FIELD:
         if "field" not in time:
             raise ValueError(
                 f"Extractor {time['extractor']} requires 'field' specification"
@@ -201,36 +295,13 @@ def _validate_analyzer_section(analyzer: Dict[str, Any]) -> None:
     if not isinstance(analyzer["name"], str):
         raise ValueError("Analyzer name must be a string")
 
+    concurrency = analyzer.get("concurrency", 1)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool):
+        raise ValueError("Analyzer concurrency must be an integer")
+    if concurrency < 1:
+        raise ValueError("Analyzer concurrency must be at least 1")
+
 
 def create_default_config() -> Dict[str, Any]:
     """Create a default configuration template."""
-    return {
-        "project": {
-            "name": "my-geoexhibit-project",
-            "collection_id": "my_collection",
-            "title": "My GeoExhibit Collection",
-            "description": "A collection of geospatial analyses",
-        },
-        "aws": {"s3_bucket": "your-bucket-name", "region": "ap-southeast-2"},
-        "map": {
-            "pmtiles": {
-                "feature_id_property": "feature_id",
-                "minzoom": 5,
-                "maxzoom": 14,
-            },
-            "base_url": "",
-        },
-        "stac": {
-            "use_extensions": ["proj", "raster", "processing"],
-            "geometry_in_item": True,
-        },
-        "ids": {"strategy": "ulid", "prefix": ""},
-        "time": {
-            "mode": "declarative",
-            "extractor": "attribute_date",
-            "field": "properties.fire_date",
-            "format": "auto",
-            "tz": "UTC",
-        },
-        "analyzer": {"name": "demo"},
-    }
+    return copy.deepcopy(_DEFAULT_CONFIG)
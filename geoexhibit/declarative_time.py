@@ -1,12 +1,114 @@
 """Declarative time provider implementation for GeoExhibit."""
 
+import functools
 import re
-from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+import sys
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from .time_provider import TimeProvider
 from .timespan import TimeSpan
 
+# Formats tried in order when the configured format is "auto"
+_AUTO_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y%m%d",
+)
+
+# Zero-padded numeric strptime directives, in datetime() argument order
+_FIXED_WIDTH_DIRECTIVES = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+_DIRECTIVE_ORDER = "YmdHMS"
+_DIRECTIVE_DEFAULTS = (1900, 1, 1, 0, 0, 0)
+
+_Parser = Callable[[str], Optional[datetime]]
+
+# Epoch values above Jan 1, 2100 in seconds are taken to be milliseconds
+_MILLISECOND_EPOCH_THRESHOLD = 4102444800
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_format(fmt: str) -> Optional[Tuple[int, _Parser]]:
+    """
+    Compile a strptime format into a parser that slices fixed-width fields.
+
+    Only formats made of literal characters and zero-padded numeric
+    directives are compiled; None is returned for anything else. Returns the
+    width of values in that format and the parser. The parser returns a
+    naive datetime, None when the value does not have the format's exact
+    fixed-width shape, and raises ValueError for out-of-range fields, so
+    callers can fall back to strptime for the general case.
+    """
+    fields: List[Tuple[int, int, int]] = []
+    literals: List[Tuple[int, str]] = []
+    seen = set()
+    pos = 0
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char != "%":
+            literals.append((pos, char))
+            pos += 1
+            i += 1
+            continue
+
+        directive = fmt[i + 1 : i + 2]
+        if directive == "%":
+            literals.append((pos, "%"))
+            pos += 1
+        elif directive in _FIXED_WIDTH_DIRECTIVES and directive not in seen:
+            seen.add(directive)
+            width = _FIXED_WIDTH_DIRECTIVES[directive]
+            fields.append((_DIRECTIVE_ORDER.index(directive), pos, pos + width))
+            pos += width
+        else:
+            return None
+        i += 2
+
+    length = pos
+
+    def parse(value: str) -> Optional[datetime]:
+        if len(value) != length:
+            return None
+        for literal_pos, literal in literals:
+            if value[literal_pos] != literal:
+                return None
+
+        parts = list(_DIRECTIVE_DEFAULTS)
+        for index, start, end in fields:
+            digits = value[start:end]
+            if not (digits.isascii() and digits.isdigit()):
+                return None
+            parts[index] = int(digits)
+        year, month, day, hour, minute, second = parts
+        return datetime(year, month, day, hour, minute, second)
+
+    return length, parse
+
+
+def _auto_parsers_by_width() -> Dict[int, Tuple[_Parser, ...]]:
+    """Group the compiled auto formats by value width, keeping their order."""
+    parsers: Dict[int, Tuple[_Parser, ...]] = {}
+    for fmt in _AUTO_FORMATS:
+        compiled = _compile_format(fmt)
+        if compiled is not None:
+            width, parser = compiled
+            parsers[width] = parsers.get(width, ()) + (parser,)
+    return parsers
+
+
+# A value's length picks the only auto formats that can match it exactly
+_AUTO_PARSERS_BY_WIDTH = _auto_parsers_by_width()
+
+
+def _split_field_path(field_path: str) -> Tuple[str, ...]:
+    """Split a dot notation field path into interned keys."""
+    return tuple(sys.intern(key) for key in field_path.split("."))
+
 
 class DeclarativeTimeProvider(TimeProvider):
     """
@@ -14,6 +116,21 @@ class DeclarativeTimeProvider(TimeProvider):
     Supports multiple extractors: attribute_date, attribute_interval, etc.
     """
 
+    __slots__ = (
+        "config",
+        "extractor",
+        "field",
+        "format_str",
+        "timezone_str",
+        "timezone_info",
+        "_extract",
+        "_field_keys",
+        "_end_field_keys",
+        "_fanout_as_list",
+        "_default_duration",
+        "_regex",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize declarative time provider with configuration."""
         self.config = config
@@ -23,30 +140,48 @@ class DeclarativeTimeProvider(TimeProvider):
         self.timezone_str = config.get("tz", "UTC")
         self.timezone_info = timezone.utc
 
+        # The extractor is fixed per provider, so it is resolved once here
+        extractors: Dict[str, Callable[[Dict[str, Any]], List[TimeSpan]]] = {
+            "attribute_date": self._extract_attribute_date,
+            "attribute_interval": self._extract_attribute_interval,
+            "fixed_annual_dates": self._extract_fixed_annual_dates,
+            "from_epoch": self._extract_from_epoch,
+            "regex_from_string": self._extract_regex_from_string,
+        }
+        if self.extractor not in extractors:
+            raise ValueError(f"Unsupported extractor: {self.extractor}")
+        self._extract = extractors[self.extractor]
+
+        # Dot paths are split once here rather than for every feature, into
+        # interned keys so dict probes can match interned keys on identity
+        self._field_keys = _split_field_path(self.field)
+        interval_config = config.get("interval", {})
+        end_field = interval_config.get("end_field")
+        self._end_field_keys = _split_field_path(end_field) if end_field else None
+
+        # Remaining extractor options are also fixed for every feature
+        self._fanout_as_list = config.get("fanout", {}).get("as_list", False)
+        default_days = interval_config.get("default_days", 0)
+        self._default_duration = (
+            timedelta(days=default_days) if default_days > 0 else None
+        )
+        self._regex: Optional[re.Pattern[str]] = None
+        if self.extractor == "regex_from_string":
+            pattern = config.get("regex", {}).get("pattern", r"\d{4}-\d{2}-\d{2}")
+            self._regex = re.compile(pattern)
+
     def for_feature(self, feature: Dict[str, Any]) -> List[TimeSpan]:
         """Extract time spans from feature based on extractor configuration."""
-        if self.extractor == "attribute_date":
-            return self._extract_attribute_date(feature)
-        elif self.extractor == "attribute_interval":
-            return self._extract_attribute_interval(feature)
-        elif self.extractor == "fixed_annual_dates":
-            return self._extract_fixed_annual_dates(feature)
-        elif self.extractor == "from_epoch":
-            return self._extract_from_epoch(feature)
-        elif self.extractor == "regex_from_string":
-            return self._extract_regex_from_string(feature)
-        else:
-            raise ValueError(f"Unsupported extractor: {self.extractor}")
+        return self._extract(feature)
 
     def _extract_attribute_date(self, feature: Dict[str, Any]) -> List[TimeSpan]:
         """Extract a single date from a feature attribute."""
-        value = self._get_nested_value(feature, self.field)
+        value = self._get_nested_value(feature, self._field_keys)
 
         if value is None:
             return []
 
-        fanout_config = self.config.get("fanout", {})
-        if fanout_config.get("as_list", False) and isinstance(value, list):
+        if self._fanout_as_list and isinstance(value, list):
             time_spans = []
             for date_value in value:
                 dt = self._parse_datetime(date_value)
@@ -59,7 +194,7 @@ class DeclarativeTimeProvider(TimeProvider):
 
     def _extract_attribute_interval(self, feature: Dict[str, Any]) -> List[TimeSpan]:
         """Extract a date interval from feature attributes."""
-        start_value = self._get_nested_value(feature, self.field)
+        start_value = self._get_nested_value(feature, self._field_keys)
 
         if start_value is None:
             return []
@@ -68,21 +203,15 @@ class DeclarativeTimeProvider(TimeProvider):
         if not start_dt:
             return []
 
-        interval_config = self.config.get("interval", {})
-        end_field = interval_config.get("end_field")
         end_dt = None
 
-        if end_field:
-            end_value = self._get_nested_value(feature, end_field)
+        if self._end_field_keys:
+            end_value = self._get_nested_value(feature, self._end_field_keys)
             if end_value:
                 end_dt = self._parse_datetime(end_value)
 
-        if not end_dt:
-            default_days = interval_config.get("default_days", 0)
-            if default_days > 0:
-                from datetime import timedelta
-
-                end_dt = start_dt + timedelta(days=default_days)
+        if not end_dt and self._default_duration is not None:
+            end_dt = start_dt + self._default_duration
 
         return [TimeSpan(start=start_dt, end=end_dt)]
 
@@ -92,20 +221,25 @@ class DeclarativeTimeProvider(TimeProvider):
 
     def _extract_from_epoch(self, feature: Dict[str, Any]) -> List[TimeSpan]:
         """Extract datetime from epoch timestamp."""
-        value = self._get_nested_value(feature, self.field)
+        value = self._get_nested_value(feature, self._field_keys)
 
         if value is None:
             return []
 
-        try:
-            if isinstance(value, (int, float)):
-                timestamp = value
-            else:
+        if isinstance(value, (int, float)):
+            timestamp = value
+        elif isinstance(value, str):
+            try:
                 timestamp = float(value)
+            except ValueError:
+                return []
+        else:
+            return []
 
-            if timestamp > 4102444800:  # Jan 1, 2100 in seconds
-                timestamp = timestamp / 1000  # Convert from milliseconds
+        if timestamp > _MILLISECOND_EPOCH_THRESHOLD:
+            timestamp = timestamp / 1000  # Convert from milliseconds
 
+        try:
             dt = datetime.fromtimestamp(timestamp, tz=self.timezone_info)
             return [TimeSpan(start=dt)]
 
@@ -114,36 +248,41 @@ class DeclarativeTimeProvider(TimeProvider):
 
     def _extract_regex_from_string(self, feature: Dict[str, Any]) -> List[TimeSpan]:
         """Extract date from string using regex pattern."""
-        value = self._get_nested_value(feature, self.field)
+        value = self._get_nested_value(feature, self._field_keys)
 
         if not isinstance(value, str):
             return []
 
-        regex_config = self.config.get("regex", {})
-        pattern = regex_config.get("pattern", r"\d{4}-\d{2}-\d{2}")
-
-        matches = re.findall(pattern, value)
-        if matches:
-            dt = self._parse_datetime(matches[0])
-            return [TimeSpan(start=dt)] if dt else []
+        assert self._regex is not None
+        match = self._regex.search(value)
+        if match is None:
+            return []
 
-        return []
+        # Same value re.findall would give for the first match: the whole
+        # match, the single group, or a tuple of groups (never a date)
+        groups = self._regex.groups
+        if groups > 1:
+            return []
+        dt = self._parse_datetime(match.group(groups))
+        return [TimeSpan(start=dt)] if dt else []
 
-    def _get_nested_value(self, data: Dict[str, Any], field_path: str) -> Any:
-        """Get value from nested dictionary using dot notation."""
-        keys = field_path.split(".")
-        current = data
+    def _get_nested_value(self, data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+        """Get value from nested dictionary using pre-split dot notation keys."""
+        current: Any = data
 
         for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+            if not isinstance(current, dict):
                 return None
+            current = current.get(key)
 
         return current
 
     def _parse_datetime(self, value: Any) -> Optional[datetime]:
         """Parse datetime from various formats."""
+        # Strings are the common case, so they are checked first
+        if isinstance(value, str):
+            return _parse_datetime_string(value, self.format_str, self.timezone_info)
+
         if isinstance(value, datetime):
             return (
                 value.replace(tzinfo=self.timezone_info)
@@ -151,44 +290,57 @@ class DeclarativeTimeProvider(TimeProvider):
                 else value
             )
 
-        if not isinstance(value, str):
-            return None
+        return None
+
 
-        if self.format_str == "auto":
-            formats = [
-                "%Y-%m-%d",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%d %H:%M:%S",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-                "%Y%m%d",
-            ]
-
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(value, fmt)
-                    return dt.replace(tzinfo=self.timezone_info)
-                except ValueError:
-                    continue
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_string(
+    value: str, format_str: str, tz: tzinfo
+) -> Optional[datetime]:
+    """
+    Parse a date string with the configured format ("auto" or strptime).
 
+    Results are cached by value, format and timezone, since features often
+    share the same dates.
+    """
+    if format_str == "auto":
+        # Fixed-width parsers reject non-matching shapes without strptime
+        for parser in _AUTO_PARSERS_BY_WIDTH.get(len(value), ()):
             try:
-                if value.endswith("Z"):
-                    value = value[:-1] + "+00:00"
-                dt = datetime.fromisoformat(value)
-                return (
-                    dt.replace(tzinfo=self.timezone_info) if dt.tzinfo is None else dt
-                )
+                dt = parser(value)
             except ValueError:
-                pass
+                continue
+            if dt is not None:
+                return dt.replace(tzinfo=tz)
 
-            return None
-        else:
+        # strptime also accepts unpadded fields the fast path rejects
+        for fmt in _AUTO_FORMATS:
             try:
-                dt = datetime.strptime(value, self.format_str)
-                return dt.replace(tzinfo=self.timezone_info)
+                return datetime.strptime(value, fmt).replace(tzinfo=tz)
             except ValueError:
-                return None
+                continue
+
+        try:
+            # fromisoformat accepts a trailing "Z" since Python 3.11
+            dt = datetime.fromisoformat(value)
+            return dt.replace(tzinfo=tz) if dt.tzinfo is None else dt
+        except ValueError:
+            pass
+
+        return None
+
+    compiled = _compile_format(format_str)
+    try:
+        parsed = compiled[1](value) if compiled is not None else None
+        dt = parsed or datetime.strptime(value, format_str)
+        return dt.replace(tzinfo=tz)
+    except ValueError:
+        return None
+
+
+def clear_time_caches() -> None:
+    """Clear cached date parsing results, e.g. in long-running processes."""
+    _parse_datetime_string.cache_clear()
 
 
 def create_declarative_time_provider(config: Dict[str, Any]) -> DeclarativeTimeProvider:
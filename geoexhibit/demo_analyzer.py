@@ -1,14 +1,12 @@
 """Demo analyzer that generates sample COG outputs for testing and demonstration."""
 
+import functools
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import numpy as np
-import rasterio
-from rasterio.crs import CRS
-from rasterio.transform import from_bounds
-from shapely.geometry import shape
+import numpy.typing as npt
 
 from .analyzer import Analyzer, AnalyzerOutput, AssetSpec
 from .timespan import TimeSpan
@@ -23,6 +21,7 @@ class DemoAnalyzer(Analyzer):
         """Initialize the demo analyzer."""
         self.output_dir = output_dir or Path(tempfile.mkdtemp())
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._rng = np.random.default_rng()
 
     @property
     def name(self) -> str:
@@ -60,6 +59,12 @@ class DemoAnalyzer(Analyzer):
         self, feature: Dict[str, Any], timespan: TimeSpan, feature_id: str
     ) -> Path:
         """Generate a Cloud Optimized GeoTIFF for the feature."""
+        import rasterio
+        from rasterio.crs import CRS
+        from rasterio.enums import Resampling
+        from rasterio.transform import from_bounds
+        from shapely.geometry import shape
+
         geom = shape(feature["geometry"])
         bounds = geom.bounds
 
@@ -93,14 +98,14 @@ class DemoAnalyzer(Analyzer):
             "tiled": True,
             "blockxsize": 256,
             "blockysize": 256,
-            "compress": "lzw",
             "predictor": 2,
+            **_cog_compression(),
         }
 
         with rasterio.Env(GDAL_TIFF_OVR_BLOCKSIZE=256):
             with rasterio.open(output_path, "w", **profile) as dst:
                 dst.write(data, 1)
-                dst.build_overviews([2, 4, 8], rasterio.enums.Resampling.average)
+                dst.build_overviews([2, 4, 8], Resampling.average)
                 dst.update_tags(ns="rio_overview", resampling="average")
 
         return output_path
@@ -113,31 +118,91 @@ class DemoAnalyzer(Analyzer):
         height: int,
         timespan: TimeSpan,
     ) -> Any:
-        """Generate synthetic raster data."""
-        minx, miny, maxx, maxy = bounds
-        x = np.linspace(minx, maxx, width)
-        y = np.linspace(maxy, miny, height)
-        xx, yy = np.meshgrid(x, y)
-
+        """Generate synthetic float32 raster data for one feature and time."""
         centroid = geom.centroid
-        cx, cy = centroid.x, centroid.y
-
-        distances = np.sqrt((xx - cx) ** 2 + (yy - cy) ** 2)
+        pattern, outside = _spatial_pattern(
+            bounds, centroid.x, centroid.y, width, height
+        )
 
         day_of_year = timespan.start.timetuple().tm_yday
         time_factor = np.sin(day_of_year * 2 * np.pi / 365) * 0.3 + 1.0
 
-        base_values = np.cos(distances * 10) * np.exp(-distances * 2) * time_factor
-
-        noise = np.random.normal(0, 0.1, base_values.shape)
-        data = base_values + noise
-
-        data = np.clip(data, -1, 1)
-
-        mask = distances > 0.5
-        data[mask] = -9999
-
-        return data.astype(np.float32)
+        data = np.multiply(pattern, np.float32(time_factor))
+
+        noise = self._rng.standard_normal(data.shape, dtype=np.float32)
+        noise *= np.float32(0.1)
+        data += noise
+
+        np.clip(data, -1, 1, out=data)
+        data[outside] = -9999
+
+        return data
+
+
+@functools.lru_cache(maxsize=8)
+def _spatial_pattern(
+    bounds: tuple[float, float, float, float],
+    cx: float,
+    cy: float,
+    width: int,
+    height: int,
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.bool_]]:
+    """
+    Compute the time-independent part of the demo raster and its nodata mask.
+
+    Cached so a feature's timespans share one grid; the arrays are read-only.
+    """
+    minx, miny, maxx, maxy = bounds
+
+    # Offsets are taken in float64 on the 1-D axes, then broadcast into a
+    # single float32 distance grid instead of meshgrid's 2-D copies
+    dx = (np.linspace(minx, maxx, width) - cx).astype(np.float32)
+    dy = (np.linspace(maxy, miny, height) - cy).astype(np.float32)
+    distances = np.hypot(dx, dy[:, np.newaxis])
+
+    pattern = np.multiply(distances, np.float32(10))
+    np.cos(pattern, out=pattern)
+    falloff = np.multiply(distances, np.float32(-2))
+    np.exp(falloff, out=falloff)
+    pattern *= falloff
+
+    outside = distances > 0.5
+    pattern.flags.writeable = False
+    outside.flags.writeable = False
+    return pattern, outside
+
+
+@functools.lru_cache(maxsize=None)
+def _cog_compression() -> Dict[str, Any]:
+    """
+    Pick GeoTIFF compression options, preferring fast ZSTD over LZW.
+
+    GDAL builds without libzstd cannot write ZSTD, so this is probed once
+    with a tiny in-memory raster.
+    """
+    from rasterio.errors import RasterioError
+    from rasterio.io import MemoryFile
+    from rasterio.transform import from_origin
+
+    zstd = {"compress": "zstd", "zstd_level": 1}
+    probe = {
+        "driver": "GTiff",
+        "width": 1,
+        "height": 1,
+        "count": 1,
+        "dtype": "uint8",
+        "transform": from_origin(0, 1, 1, 1),
+    }
+    try:
+        with MemoryFile() as memfile:
+            with memfile.open(**probe, **zstd) as dst:
+                dst.write(np.zeros((1, 1, 1), dtype=np.uint8))
+            with memfile.open() as src:
+                supported = src.profile.get("compress") == "zstd"
+    except RasterioError:
+        supported = False
+
+    return zstd if supported else {"compress": "lzw"}
 
 
 def create_demo_analyzer(output_dir: Optional[Path] = None) -> DemoAnalyzer:
@@ -0,0 +1,39 @@
+"""ULID generation helpers for GeoExhibit."""
+
+import os
+from typing import List
+
+import ulid
+
+# A ULID is a 48-bit millisecond timestamp followed by 80 random bits.
+_TIMESTAMP_BYTES = 6
+_RANDOMNESS_BYTES = 10
+_RANDOMNESS_BITS = _RANDOMNESS_BYTES * 8
+_TIMESTAMP_MASK = (1 << (_TIMESTAMP_BYTES * 8)) - 1
+
+
+def new_ulids(count: int) -> List[str]:
+    """
+    Generate count monotonic ULID strings in one batch.
+
+    The batch reads the clock and the entropy source once: the first ID
+    gets a random 80-bit value and each following ID increments it, so
+    the IDs sort in generation order. If the increment overflows the
+    random part, the timestamp is bumped by one millisecond.
+    """
+    if count <= 0:
+        return []
+
+    timestamp = int.from_bytes(ulid.new().bytes[:_TIMESTAMP_BYTES], "big")
+    randomness = int.from_bytes(os.urandom(_RANDOMNESS_BYTES), "big")
+    base = (timestamp << _RANDOMNESS_BITS) | randomness
+
+    ids = []
+    for i in range(count):
+        value = base + i
+        # Carry out of the random part lands in the timestamp; wrap it to 48 bits
+        value_timestamp = (value >> _RANDOMNESS_BITS) & _TIMESTAMP_MASK
+        value_randomness = value & ((1 << _RANDOMNESS_BITS) - 1)
+        value = (value_timestamp << _RANDOMNESS_BITS) | value_randomness
+        ids.append(str(ulid.from_bytes(value.to_bytes(16, "big"))))
+    return ids
@@ -1,65 +1,84 @@
 """Canonical S3/STAC layout paths for GeoExhibit."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CanonicalLayout:
     """
     Canonical S3/STAC layout paths for GeoExhibit.
     This layout is hard-coded and not configurable by users.
+
+    Directory prefixes are computed once at construction since the layout
+    is consulted for every item and asset a job publishes.
     """
 
     job_id: str
+    _job_root: str = field(init=False, repr=False, compare=False)
+    _stac_root: str = field(init=False, repr=False, compare=False)
+    _items_root: str = field(init=False, repr=False, compare=False)
+    _pmtiles_root: str = field(init=False, repr=False, compare=False)
+    _assets_root: str = field(init=False, repr=False, compare=False)
+    _thumbs_root: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        job_root = f"jobs/{self.job_id}/"
+        stac_root = f"{job_root}stac/"
+        object.__setattr__(self, "_job_root", job_root)
+        object.__setattr__(self, "_stac_root", stac_root)
+        object.__setattr__(self, "_items_root", f"{stac_root}items/")
+        object.__setattr__(self, "_pmtiles_root", f"{job_root}pmtiles/")
+        object.__setattr__(self, "_assets_root", f"{job_root}assets/")
+        object.__setattr__(self, "_thumbs_root", f"{job_root}thumbs/")
 
     @property
     def job_root(self) -> str:
         """Root path for this job: jobs/<job_id>/"""
-        return f"jobs/{self.job_id}/"
+        return self._job_root
 
     @property
     def stac_root(self) -> str:
         """STAC root path: jobs/<job_id>/stac/"""
-        return f"{self.job_root}stac/"
+        return self._stac_root
 
     @property
     def collection_path(self) -> str:
         """Collection JSON path: jobs/<job_id>/stac/collection.json"""
-        return f"{self.stac_root}collection.json"
+        return f"{self._stac_root}collection.json"
 
     @property
     def items_root(self) -> str:
         """Items directory: jobs/<job_id>/stac/items/"""
-        return f"{self.stac_root}items/"
+        return self._items_root
 
     def item_path(self, item_id: str) -> str:
         """Item JSON path: jobs/<job_id>/stac/items/<item_id>.json"""
-        return f"{self.items_root}{item_id}.json"
+        return f"{self._items_root}{item_id}.json"
 
     @property
     def pmtiles_root(self) -> str:
         """PMTiles directory: jobs/<job_id>/pmtiles/"""
-        return f"{self.job_root}pmtiles/"
+        return self._pmtiles_root
 
     @property
     def pmtiles_path(self) -> str:
         """Standard PMTiles file path: jobs/<job_id>/pmtiles/features.pmtiles"""
-        return f"{self.pmtiles_root}features.pmtiles"
+        return f"{self._pmtiles_root}features.pmtiles"
 
     @property
     def assets_root(self) -> str:
         """Assets directory: jobs/<job_id>/assets/"""
-        return f"{self.job_root}assets/"
+        return self._assets_root
 
     def asset_path(self, item_id: str, asset_name: str) -> str:
         """Asset path: jobs/<job_id>/assets/<item_id>/<asset_name>"""
-        return f"{self.assets_root}{item_id}/{asset_name}"
+        return f"{self._assets_root}{item_id}/{asset_name}"
 
     @property
     def thumbs_root(self) -> str:
         """Thumbnails directory: jobs/<job_id>/thumbs/"""
-        return f"{self.job_root}thumbs/"
+        return self._thumbs_root
 
     def thumb_path(self, item_id: str, thumb_name: str) -> str:
         """Thumbnail path: jobs/<job_id>/thumbs/<item_id>/<thumb_name>"""
-        return f"{self.thumbs_root}{item_id}/{thumb_name}"
+        return f"{self._thumbs_root}{item_id}/{thumb_name}"
@@ -1,14 +1,23 @@
 """Orchestrator for coordinating feature analysis and publish plan creation."""
 
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import IO, Dict, Any, Iterator, List, Optional, Set, Tuple
 from ulid import new as new_ulid
 
-from .analyzer import Analyzer
+from .analyzer import Analyzer, AnalyzerOutput
 from .config import GeoExhibitConfig
 from .declarative_time import DeclarativeTimeProvider
+from .ids import new_ulids
 from .publish_plan import PublishItem, PublishPlan
 from .time_provider import TimeProvider, create_time_provider
+from .timespan import TimeSpan
+
+_TIPPECANOE_FLAGS = ("--force", "--no-tile-compression", "--drop-densest-as-needed")
+
+# tippecanoe reports progress on stderr; only this much is kept for errors.
+_TIPPECANOE_STDERR_TAIL = 64 * 1024
 
 
 def create_publish_plan(
@@ -42,26 +51,47 @@ def create_publish_plan(
     job_id = str(new_ulid())
     items = []
 
+    # One pass finds features without ids and collects geometry types
+    geometry_types: Set[str] = set()
+    missing_id_props = []
     for feature in feature_list:
-        _ensure_feature_has_id(feature, config.ids.get("prefix", ""))
-
-        time_spans = list(time_provider.for_feature(feature))
-
-        for timespan in time_spans:
-            item_id = str(new_ulid())
-
-            analyzer_output = analyzer.analyze(feature, timespan)
-
-            item = PublishItem(
-                item_id=item_id,
-                feature=feature,
-                timespan=timespan,
-                analyzer_output=analyzer_output,
-            )
-
-            items.append(item)
-
-    collection_metadata = _build_collection_metadata(config, features)
+        props = feature.setdefault("properties", {})
+        if not props.get("feature_id"):
+            missing_id_props.append(props)
+        geometry_type = _feature_geometry(feature).get("type")
+        if geometry_type is not None:
+            geometry_types.add(geometry_type)
+
+    id_prefix = config.ids.get("prefix", "")
+    for props, feature_id in zip(missing_id_props, new_ulids(len(missing_id_props))):
+        props["feature_id"] = f"{id_prefix}{feature_id}"
+
+    feature_times = [
+        (feature, timespan)
+        for feature, time_spans in zip(
+            feature_list, time_provider.for_features(feature_list)
+        )
+        for timespan in time_spans
+    ]
+
+    analyzer_outputs = _analyze_feature_times(
+        analyzer, feature_times, config.analyzer_concurrency
+    )
+    for (feature, timespan), item_id, analyzer_output in zip(
+        feature_times, new_ulids(len(feature_times)), analyzer_outputs
+    ):
+        item = PublishItem(
+            item_id=item_id,
+            feature=feature,
+            timespan=timespan,
+            analyzer_output=analyzer_output,
+        )
+
+        items.append(item)
+
+    collection_metadata = _build_collection_metadata(
+        config, len(feature_list), geometry_types
+    )
 
     plan = PublishPlan(
         collection_id=config.collection_id,
@@ -74,6 +104,28 @@ def create_publish_plan(
     return plan
 
 
+def _analyze_feature_times(
+    analyzer: Analyzer,
+    feature_times: List[Tuple[Dict[str, Any], TimeSpan]],
+    concurrency: int,
+) -> Iterator[AnalyzerOutput]:
+    """
+    Run the analyzer for each feature/time pair, yielding outputs in order.
+
+    Analyzers run one at a time unless analyzer.concurrency allows more, since
+    not every analyzer is safe to call from several threads.
+    """
+    if concurrency <= 1 or len(feature_times) <= 1:
+        for feature, timespan in feature_times:
+            yield analyzer.analyze(feature, timespan)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(feature_times))
+    ) as executor:
+        yield from executor.map(lambda pair: analyzer.analyze(*pair), feature_times)
+
+
 def _create_time_provider_from_config(config: GeoExhibitConfig) -> TimeProvider:
     """Create TimeProvider instance from configuration."""
     time_config = config.time_config
@@ -87,21 +139,10 @@ def _create_time_provider_from_config(config: GeoExhibitConfig) -> TimeProvider:
         raise ValueError(f"Unknown time provider mode: {time_config['mode']}")
 
 
-def _ensure_feature_has_id(feature: Dict[str, Any], id_prefix: str = "") -> None:
-    """Ensure feature has a feature_id property, generating one if missing."""
-    props = feature.setdefault("properties", {})
-
-    if "feature_id" not in props or not props["feature_id"]:
-        feature_id = f"{id_prefix}{new_ulid()}" if id_prefix else str(new_ulid())
-        props["feature_id"] = feature_id
-
-
 def _build_collection_metadata(
-    config: GeoExhibitConfig, features: Dict[str, Any]
+    config: GeoExhibitConfig, feature_count: int, geometry_types: Set[str]
 ) -> Dict[str, Any]:
-    """Build collection metadata from configuration and feature collection."""
-    feature_list = features.get("features", [])
-
+    """Build collection metadata from configuration and feature statistics."""
     metadata = {
         "title": config.project["title"],
         "description": config.project["description"],
@@ -109,20 +150,21 @@ def _build_collection_metadata(
         "license": "proprietary",
     }
 
-    if feature_list:
-        metadata["feature_count"] = len(feature_list)
-
-        geometry_types = set()
-        for feature in feature_list:
-            if "geometry" in feature and "type" in feature["geometry"]:
-                geometry_types.add(feature["geometry"]["type"])
+    if feature_count:
+        metadata["feature_count"] = feature_count
 
         if geometry_types:
-            metadata["geometry_types"] = sorted(list(geometry_types))
+            metadata["geometry_types"] = sorted(geometry_types)
 
     return metadata
 
 
+def _feature_geometry(feature: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a feature's geometry, treating a missing or null geometry as empty."""
+    geometry = feature.get("geometry")
+    return geometry if isinstance(geometry, dict) else {}
+
+
 def generate_pmtiles_plan(
     features: Dict[str, Any], config: GeoExhibitConfig, job_id: str
 ) -> str:
@@ -154,37 +196,58 @@ def _generate_pmtiles_from_features(
     features: Dict[str, Any], output_path: Path, config: GeoExhibitConfig
 ) -> None:
     """Generate PMTiles file from features using tippecanoe."""
-    import json
     import subprocess
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".geojson", delete=False) as f:
-        json.dump(features, f)
-        temp_geojson = f.name
-
-    try:
-        pmtiles_config = config.map.get("pmtiles", {})
-        minzoom = pmtiles_config.get("minzoom", 5)
-        maxzoom = pmtiles_config.get("maxzoom", 14)
-
-        cmd = [
-            "tippecanoe",
-            "-o",
-            str(output_path),
-            "-z",
-            str(maxzoom),
-            "-Z",
-            str(minzoom),
-            "--force",
-            "--no-tile-compression",
-            "--drop-densest-as-needed",
-            temp_geojson,
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"tippecanoe failed: {result.stderr}")
-
-    finally:
-        Path(temp_geojson).unlink(missing_ok=True)
+    import threading
+
+    import orjson
+
+    # tippecanoe reads GeoJSON from stdin when given no input files, so the
+    # features are piped in rather than written to a temporary file first
+    geojson = orjson.dumps(features, option=orjson.OPT_NON_STR_KEYS)
+
+    pmtiles_config = config.map.get("pmtiles", {})
+    minzoom = pmtiles_config.get("minzoom", 5)
+    maxzoom = pmtiles_config.get("maxzoom", 14)
+
+    cmd = [
+        "tippecanoe",
+        "-o",
+        str(output_path),
+        "-z",
+        str(maxzoom),
+        "-Z",
+        str(minzoom),
+        *_TIPPECANOE_FLAGS,
+    ]
+
+    # stdout is discarded. stdin is fed from a thread so stderr can be
+    # drained here without either pipe filling up. Only its tail is retained.
+    stderr_tail = bytearray()
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    ) as process:
+        assert process.stdin is not None and process.stderr is not None
+        writer = threading.Thread(
+            target=_write_and_close, args=(process.stdin, geojson), daemon=True
+        )
+        writer.start()
+        while chunk := process.stderr.read(_TIPPECANOE_STDERR_TAIL):
+            stderr_tail += chunk
+            del stderr_tail[:-_TIPPECANOE_STDERR_TAIL]
+        writer.join()
+
+    if process.returncode != 0:
+        stderr = stderr_tail.decode(errors="replace")
+        raise RuntimeError(f"tippecanoe failed: {stderr}")
+
+
+def _write_and_close(stream: IO[bytes], data: bytes) -> None:
+    """Write data to a subprocess pipe and close it."""
+    # If the process exits early, its return code and stderr say why
+    with contextlib.suppress(BrokenPipeError):
+        stream.write(data)
+    with contextlib.suppress(BrokenPipeError):
+        stream.close()
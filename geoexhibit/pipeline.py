@@ -2,8 +2,12 @@
 
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Union
+
+import orjson
 
 from .config import GeoExhibitConfig
 from . import plugin_registry
@@ -12,6 +16,15 @@ from .publisher import create_publisher
 
 logger = logging.getLogger(__name__)
 
+_JSON_WHITESPACE = b" \t\r\n"
+
+# GeoJSON files above this size are parsed incrementally when ijson is installed
+_LARGE_GEOJSON_BYTES = 256 * 1024 * 1024
+
+# Vector formats read through GDAL/OGR with the optional pyogrio package
+_OGR_SUFFIXES = frozenset({".gpkg", ".shp", ".fgb"})
+_WGS84_CRS = frozenset({"EPSG:4326", "OGC:CRS84"})
+
 
 def run_geoexhibit_pipeline(
     config: GeoExhibitConfig,
@@ -53,6 +66,9 @@ def run_geoexhibit_pipeline(
         raise
 
     plan = create_publish_plan(features, analyzer, config)
+    analyzer_output_dir = getattr(analyzer, "output_dir", None)
+    if analyzer_output_dir is not None:
+        plan.work_dirs.append(str(analyzer_output_dir))
     logger.info(
         f"Created publish plan: {plan.item_count} items from {plan.feature_count} features"
     )
@@ -61,6 +77,7 @@ def run_geoexhibit_pipeline(
     try:
         pmtiles_path = generate_pmtiles_plan(features, config, plan.job_id)
         plan.pmtiles_path = pmtiles_path
+        plan.work_dirs.append(str(Path(pmtiles_path).parent))
         logger.info(f"Generated PMTiles: {pmtiles_path}")
     except Exception as e:
         logger.warning(f"PMTiles generation failed (tippecanoe required): {e}")
@@ -98,42 +115,189 @@ def load_and_validate_features(features_file: Path) -> Dict[str, Any]:
     suffix = features_file.suffix.lower()
 
     if suffix in [".json", ".geojson"]:
-        with open(features_file) as f:
-            features = json.load(f)
+        features = None
+        if features_file.stat().st_size > _LARGE_GEOJSON_BYTES:
+            features = _load_geojson_incrementally(features_file)
+        if features is None:
+            with open(features_file) as f:
+                features = json.load(f)
     elif suffix in [".ndjson", ".jsonl"]:
         features = load_ndjson_features(features_file)
+    elif suffix in _OGR_SUFFIXES:
+        features = load_ogr_features(features_file)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
-    validate_feature_collection(features)
-    ensure_feature_ids(features)
+    # Validation also finds the features still needing ids, in the same pass
+    _assign_feature_ids(_validate_features(features))
 
     assert isinstance(features, dict)
     return features
 
 
+def _load_geojson_incrementally(geojson_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a GeoJSON file with the optional incremental ijson parser.
+
+    The file is parsed from a buffered stream, so its text is never held in
+    memory as one string, and values come through as json.load reads them.
+    Returns None if ijson is not installed, so the caller can fall back to
+    reading the file directly.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+
+    with open(geojson_file, "rb") as f:
+        try:
+            return dict(ijson.kvitems(f, "", use_float=True))
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {geojson_file}: {e}") from e
+
+
 def load_ndjson_features(ndjson_file: Path) -> Dict[str, Any]:
     """Load NDJSON file and convert to FeatureCollection."""
-    features = []
-    with open(ndjson_file) as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    return {
+        "type": "FeatureCollection",
+        "features": list(iter_ndjson_features(ndjson_file)),
+    }
+
+
+def iter_ndjson_features(ndjson_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the GeoJSON Features in an NDJSON file one at a time.
+
+    Blank lines are ignored; invalid JSON and non-Feature lines are logged
+    and skipped.
+    """
+    with open(ndjson_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        # Parse lines straight out of the page cache instead of decoding each
+        # one into a Python str first.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
             try:
-                feature = json.loads(line)
-                if feature.get("type") == "Feature":
-                    features.append(feature)
-                else:
-                    logger.warning(f"Line {line_num}: Not a GeoJSON Feature, skipping")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Line {line_num}: Invalid JSON, skipping: {e}")
+                size = len(mm)
+                start = 0
+                line_num = 0
+                while start < size:
+                    line_num += 1
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    next_start = end + 1
+
+                    while start < end and mm[start] in _JSON_WHITESPACE:
+                        start += 1
+                    while end > start and mm[end - 1] in _JSON_WHITESPACE:
+                        end -= 1
+
+                    if start < end:
+                        try:
+                            feature = _parse_ndjson_feature(view[start:end], line_num)
+                        except orjson.JSONDecodeError as e:
+                            logger.warning(
+                                f"Line {line_num}: Invalid JSON, skipping: {e}"
+                            )
+                        else:
+                            if feature is not None:
+                                yield feature
+
+                    start = next_start
+            finally:
+                view.release()
+
+
+def _parse_ndjson_feature(
+    line: Union[bytes, memoryview], line_num: int
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse one NDJSON line into a GeoJSON Feature.
+
+    Returns None, with a warning, for valid JSON that is not a Feature.
+    Raises orjson.JSONDecodeError for invalid JSON.
+    """
+    feature = orjson.loads(line)
+    if isinstance(feature, dict) and feature.get("type") == "Feature":
+        return feature
+    logger.warning(f"Line {line_num}: Not a GeoJSON Feature, skipping")
+    return None
 
-    return {"type": "FeatureCollection", "features": features}
+
+def load_ogr_features(features_file: Path) -> Dict[str, Any]:
+    """
+    Load a GeoPackage, Shapefile or FlatGeobuf as a GeoJSON FeatureCollection.
+
+    The layer is read as one Arrow table with pyogrio, and its geometry
+    column is decoded, reprojected to EPSG:4326 if needed and written as
+    GeoJSON by shapely for the whole array at once, rather than feature by
+    feature.
+    """
+    try:
+        from pyogrio.raw import read_arrow
+    except ImportError as e:
+        raise ValueError(
+            f"Reading {features_file.suffix} files requires pyogrio and pyarrow "
+            f"(pip install 'geoexhibit[ogr]'): {e}"
+        ) from e
+
+    import shapely
+
+    meta, table = read_arrow(features_file)
+    geometry_name = meta.get("geometry_name") or "wkb_geometry"
+
+    wkb = table.column(geometry_name).to_numpy(zero_copy_only=False)
+    shapes = shapely.from_wkb(wkb)
+
+    crs = meta.get("crs")
+    if crs and crs not in _WGS84_CRS:
+        from rasterio.warp import transform
+
+        def to_wgs84(coords: Any) -> Any:
+            xs, ys = transform(crs, "EPSG:4326", coords[:, 0], coords[:, 1])
+            reprojected = coords.copy()
+            reprojected[:, 0] = xs
+            reprojected[:, 1] = ys
+            return reprojected
+
+        # One transform call covers every vertex of every geometry
+        shapes = shapely.transform(shapes, to_wgs84, include_z=None)
+
+    # GEOS writes all the GeoJSON in C and orjson parses it, which is cheaper
+    # than building coordinate lists per geometry in Python
+    geometries = [
+        orjson.loads(geojson) if geojson is not None else None
+        for geojson in shapely.to_geojson(shapes)
+    ]
+
+    properties = table.select(
+        [name for name in table.column_names if name != geometry_name]
+    ).to_pylist()
+
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": props, "geometry": geometry}
+            for props, geometry in zip(properties, geometries)
+        ],
+    }
 
 
 def validate_feature_collection(features: Dict[str, Any]) -> None:
     """Validate that a GeoJSON FeatureCollection is properly structured."""
+    _validate_features(features)
+
+
+def _validate_features(features: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Validate a FeatureCollection in one pass over its features.
+
+    Adds empty properties where missing and returns the properties dicts of
+    features without a feature_id.
+    """
     if "type" not in features or features["type"] != "FeatureCollection":
         raise ValueError("Input must be a GeoJSON FeatureCollection")
 
@@ -143,26 +307,38 @@ def validate_feature_collection(features: Dict[str, Any]) -> None:
     if not isinstance(features["features"], list):
         raise ValueError("Features must be a list")
 
+    missing_ids = []
     for i, feature in enumerate(features["features"]):
-        if "type" not in feature or feature["type"] != "Feature":
+        if not isinstance(feature, dict) or feature.get("type") != "Feature":
             raise ValueError(f"Feature {i} must have type 'Feature'")
 
-        if "geometry" not in feature or not feature["geometry"]:
+        if not feature.get("geometry"):
             raise ValueError(f"Feature {i} must have a geometry")
 
-        if "properties" not in feature:
-            feature["properties"] = {}
+        props = feature.setdefault("properties", {})
+        if not props.get("feature_id"):
+            missing_ids.append(props)
+
+    return missing_ids
 
 
 def ensure_feature_ids(features: Dict[str, Any]) -> None:
     """Ensure all features have a feature_id property using ULIDs."""
-    from ulid import new as new_ulid
-
+    missing_ids = []
     for feature in features["features"]:
-        props = feature.get("properties", {})
-        if "feature_id" not in props or not props["feature_id"]:
-            props["feature_id"] = str(new_ulid())
-            feature["properties"] = props
+        props = feature.setdefault("properties", {})
+        if not props.get("feature_id"):
+            missing_ids.append(props)
+
+    _assign_feature_ids(missing_ids)
+
+
+def _assign_feature_ids(missing_ids: List[Dict[str, Any]]) -> None:
+    """Give each properties dict a new ULID feature_id, generated in one batch."""
+    from .ids import new_ulids
+
+    for props, feature_id in zip(missing_ids, new_ulids(len(missing_ids))):
+        props["feature_id"] = feature_id
 
 
 def create_example_features() -> Dict[str, Any]:
@@ -1,6 +1,7 @@
 """Plugin registry system for analyzers in GeoExhibit."""
 
 import importlib
+import importlib.metadata
 import importlib.util
 import inspect
 import logging
@@ -57,7 +58,8 @@ class AnalyzerRegistry:
         if not self._auto_discovered:
             self._auto_discover_plugins()
 
-        if name not in self._analyzers:
+        analyzer_class = self._analyzers.get(name)
+        if analyzer_class is None:
             # User experience: provide actionable error with available options
             available = list(self._analyzers.keys())
             raise PluginNotFoundError(
@@ -65,8 +67,6 @@ class AnalyzerRegistry:
                 f"Check that the plugin is installed and properly registered."
             )
 
-        analyzer_class = self._analyzers[name]
-
         try:
             return analyzer_class(**kwargs)
         except Exception as e:
@@ -118,23 +118,17 @@ class AnalyzerRegistry:
             self._auto_discovered = True
 
     def _discover_entry_points(self) -> None:
-        """Discover plugins through setuptools entry points."""
-        try:
-            import pkg_resources  # type: ignore[import-not-found]
-
-            for entry_point in pkg_resources.iter_entry_points("geoexhibit.analyzers"):
-                try:
-                    entry_point.load()
-                    logger.debug(
-                        f"Loaded analyzer plugin via entry point: {entry_point.name}"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load entry point {entry_point.name}: {e}"
-                    )
-        except ImportError:
-            # pkg_resources not available, skip entry point discovery
-            logger.debug("pkg_resources not available, skipping entry point discovery")
+        """Discover plugins through package entry points."""
+        for entry_point in importlib.metadata.entry_points(
+            group="geoexhibit.analyzers"
+        ):
+            try:
+                entry_point.load()
+                logger.debug(
+                    f"Loaded analyzer plugin via entry point: {entry_point.name}"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load entry point {entry_point.name}: {e}")
 
     def _scan_directory(self, directory: Path) -> None:
         """Scan directory for Python modules and import them with unique names."""
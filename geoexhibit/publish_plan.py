@@ -1,6 +1,6 @@
 """Publishing plan data structures for GeoExhibit."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 
@@ -16,6 +16,15 @@ class PublishItem:
     feature: Dict[str, Any]
     timespan: TimeSpan
     analyzer_output: AnalyzerOutput
+    _properties: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        feature_props = self.feature.get("properties", {})
+        assert isinstance(feature_props, dict)
+        self._properties = {
+            **feature_props,
+            **(self.analyzer_output.extra_properties or {}),
+        }
 
     @property
     def geometry(self) -> Dict[str, Any]:
@@ -26,14 +35,13 @@ class PublishItem:
 
     @property
     def properties(self) -> Dict[str, Any]:
-        """Get combined properties from feature and analyzer output."""
-        feature_props = self.feature.get("properties", {})
-        assert isinstance(feature_props, dict)
-        props = feature_props.copy()
+        """
+        Get combined properties from feature and analyzer output.
 
-        if self.analyzer_output.extra_properties:
-            props.update(self.analyzer_output.extra_properties)
-        return props
+        Merged once at construction; callers that need to modify the
+        result must copy it first.
+        """
+        return self._properties
 
     @property
     def feature_id(self) -> str:
@@ -52,6 +60,9 @@ class PublishPlan:
     items: List[PublishItem]
     collection_metadata: Dict[str, Any]
     pmtiles_path: Optional[str] = None
+    # Directories the pipeline created for intermediate output; publishers
+    # may hard-link files from them instead of copying.
+    work_dirs: List[str] = field(default_factory=list)
 
     @property
     def item_count(self) -> int:
@@ -70,13 +81,19 @@ class PublishPlan:
         if not self.items:
             raise ValueError("Cannot get time range from empty publish plan")
 
-        start_times = [item.timespan.start for item in self.items]
-        end_times = [
-            item.timespan.end if item.timespan.end else item.timespan.start
-            for item in self.items
-        ]
-
-        return min(start_times), max(end_times)
+        # Single pass over the items instead of materializing two lists
+        first = self.items[0].timespan
+        start = first.start
+        end = first.end or first.start
+        for item in self.items:
+            timespan = item.timespan
+            if timespan.start < start:
+                start = timespan.start
+            item_end = timespan.end or timespan.start
+            if item_end > end:
+                end = item_end
+
+        return start, end
 
     def get_items_for_feature(self, feature_id: str) -> List[PublishItem]:
         """Get all items for a specific feature."""
@@ -1,25 +1,45 @@
 """Publishing functionality for uploading to S3 and local filesystems."""
 
+import hashlib
+import io
 import json
 import logging
+import os
+import shutil
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .config import GeoExhibitConfig
 from .layout import CanonicalLayout
-from .publish_plan import PublishPlan
+from .publish_plan import PublishItem, PublishPlan
 from .stac_writer import (
     write_stac_catalog,
     _fix_collection_link_hrefs,
-    _fix_item_link_hrefs,
+    _serialize_stac,
 )
 
 logger = logging.getLogger(__name__)
 
+# Objects above the threshold are sent as parallel multipart uploads.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+# Parts sent in parallel for each multipart upload.
+_MULTIPART_CONCURRENCY = 10
+
+_LOCAL_COPY_WORKERS = 8
+
+# User metadata key recording an uploaded file's SHA-256, used to skip
+# re-uploading unchanged files. ETags cannot serve: multipart ETags are
+# not content hashes.
+_SHA256_METADATA_KEY = "geoexhibit-sha256"
+
 
 class Publisher(ABC):
     """Publisher for uploading assets and STAC metadata."""
@@ -43,12 +63,35 @@ class S3Publisher(Publisher):
         self.config = config
         self.dry_run = dry_run
         self.s3_bucket = config.s3_bucket
+        # The client checksums each upload and S3 verifies and stores it.
+        # With the AWS CRT installed, CRC32C is hardware-accelerated.
+        self._checksum_args: Dict[str, str] = {}
+        if config.checksum_algorithm:
+            self._checksum_args["ChecksumAlgorithm"] = config.checksum_algorithm
+        self._transfer_config = TransferConfig(
+            multipart_threshold=_MULTIPART_THRESHOLD,
+            multipart_chunksize=_MULTIPART_CHUNKSIZE,
+            max_concurrency=_MULTIPART_CONCURRENCY,
+            use_threads=True,
+        )
+
+        # One low-level client is shared by every upload and verification
+        # thread (clients are thread-safe; resources are not). Every upload
+        # worker may run a multipart transfer sending its parts in parallel,
+        # so the pool holds a connection for each of those part requests.
+        client_config = Config(
+            max_pool_connections=config.upload_concurrency * _MULTIPART_CONCURRENCY,
+            tcp_keepalive=True,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        )
 
         try:
             if config.aws_region:
-                self.s3_client = boto3.client("s3", region_name=config.aws_region)
+                self.s3_client = boto3.client(
+                    "s3", region_name=config.aws_region, config=client_config
+                )
             else:
-                self.s3_client = boto3.client("s3")
+                self.s3_client = boto3.client("s3", config=client_config)
 
             if not dry_run:
                 self.s3_client.head_bucket(Bucket=self.s3_bucket)
@@ -67,24 +110,53 @@ class S3Publisher(Publisher):
 
         layout = CanonicalLayout(plan.job_id)
 
-        self._upload_assets(plan, layout)
+        # A single pool serves asset and STAC uploads so its worker threads
+        # and their pooled connections are reused across both phases.
+        with ThreadPoolExecutor(max_workers=self.config.upload_concurrency) as executor:
+            asset_uploads = self._upload_assets(plan, layout, executor)
+
+            # STAC hrefs depend only on the layout, so the catalog is built
+            # while assets upload. It is only published once every asset
+            # has landed, so a failed upload never leaves dangling hrefs.
+            stac_data = write_stac_catalog(plan, self.config)
+            for upload in asset_uploads:
+                upload.result()
 
-        stac_data = write_stac_catalog(plan, self.config)
-        self._upload_stac_catalog(stac_data)
+            self._upload_stac_catalog(stac_data, executor)
 
         if plan.pmtiles_path:
             self._upload_pmtiles(plan, layout)
 
         logger.info(f"Successfully published plan {plan.job_id}")
 
-    def _upload_assets(self, plan: PublishPlan, layout: CanonicalLayout) -> None:
-        """Upload all assets for all items in the plan."""
-        for item in plan.items:
-            logger.info(f"Uploading assets for item {item.item_id}")
+    def _upload_assets(
+        self, plan: PublishPlan, layout: CanonicalLayout, executor: Executor
+    ) -> List[Future[None]]:
+        """
+        Start uploading all assets for all items in the plan concurrently.
+
+        Returns one future per asset; callers must wait on them, which
+        re-raises the first failed upload.
+        """
+        uploads = [
+            executor.submit(self._upload_file, *upload)
+            for upload in self._iter_asset_uploads(plan, layout)
+        ]
 
+        logger.info(
+            f"Uploading {len(uploads)} assets for {len(plan.items)} items "
+            f"with up to {self.config.upload_concurrency} concurrent uploads"
+        )
+        return uploads
+
+    def _iter_asset_uploads(
+        self, plan: PublishPlan, layout: CanonicalLayout
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield (local path, S3 key, media type) for every asset in the plan."""
+        for item in plan.items:
             primary_asset = item.analyzer_output.primary_cog_asset
             s3_key = layout.asset_path(item.item_id, primary_asset.key)
-            self._upload_file(primary_asset.href, s3_key, primary_asset.media_type)
+            yield primary_asset.href, s3_key, primary_asset.media_type
 
             if item.analyzer_output.additional_assets:
                 for asset in item.analyzer_output.additional_assets:
@@ -92,26 +164,38 @@ class S3Publisher(Publisher):
                         s3_key = layout.thumb_path(item.item_id, asset.key)
                     else:
                         s3_key = layout.asset_path(item.item_id, asset.key)
-                    self._upload_file(asset.href, s3_key, asset.media_type)
-
-    def _upload_stac_catalog(self, stac_data: Dict[str, Any]) -> None:
-        """Upload STAC collection and items to S3."""
-        collection_path = stac_data["collection"]["path"]
-        collection_obj = stac_data["collection"]["object"]
+                    yield asset.href, s3_key, asset.media_type
 
-        # Fix collection link hrefs before uploading
-        collection_dict = _fix_collection_link_hrefs(collection_obj.to_dict())
-        collection_json = json.dumps(collection_dict, indent=2)
-        self._upload_content(collection_json, collection_path, "application/json")
+    def _upload_stac_catalog(
+        self, stac_data: Dict[str, Any], executor: Executor
+    ) -> None:
+        """Upload STAC collection and items to S3 concurrently."""
+        # Serialize the dicts write_stac_catalog built, whose item links are
+        # already fixed. The collection links are fixed on copies, leaving
+        # the returned dict (and its deferred validation) as it was built.
+        built_collection = stac_data["collection"]["dict"]
+        collection_dict = _fix_collection_link_hrefs(
+            {
+                **built_collection,
+                "links": [dict(link) for link in built_collection.get("links", [])],
+            }
+        )
+        uploads: List[Tuple[bytes, str]] = [
+            (_serialize_stac(collection_dict), stac_data["collection"]["path"])
+        ]
 
         for item_data in stac_data["items"]:
-            item_path = item_data["path"]
-            item_obj = item_data["object"]
-
-            # Fix item link hrefs before uploading
-            item_dict = _fix_item_link_hrefs(item_obj.to_dict())
-            item_json = json.dumps(item_dict, indent=2)
-            self._upload_content(item_json, item_path, "application/json")
+            uploads.append((_serialize_stac(item_data["dict"]), item_data["path"]))
+
+        # Consume the results so the first failed upload is re-raised here
+        list(
+            executor.map(
+                lambda upload: self._upload_content(
+                    upload[0], upload[1], "application/json"
+                ),
+                uploads,
+            )
+        )
 
         logger.info(
             f"Uploaded STAC catalog: 1 collection, {len(stac_data['items'])} items"
@@ -141,7 +225,7 @@ class S3Publisher(Publisher):
         if not local_file_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
-        extra_args = {}
+        extra_args: Dict[str, Any] = dict(self._checksum_args)
         if content_type:
             extra_args["ContentType"] = content_type
 
@@ -151,16 +235,50 @@ class S3Publisher(Publisher):
             )
             return
 
+        size = local_file_path.stat().st_size
+
+        if self.config.skip_unchanged_uploads:
+            with open(local_file_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            if self._is_unchanged(s3_key, size, digest):
+                logger.debug(f"Skipping unchanged s3://{self.s3_bucket}/{s3_key}")
+                return
+            extra_args["Metadata"] = {_SHA256_METADATA_KEY: digest}
+
         try:
-            self.s3_client.upload_file(
-                str(local_file_path), self.s3_bucket, s3_key, ExtraArgs=extra_args
-            )
+            if size <= _MULTIPART_THRESHOLD:
+                # Small files go out as a single PutObject; upload_file would
+                # spin up a transfer manager and its threads for each call.
+                with open(local_file_path, "rb") as body:
+                    self.s3_client.put_object(
+                        Bucket=self.s3_bucket, Key=s3_key, Body=body, **extra_args
+                    )
+            else:
+                self.s3_client.upload_file(
+                    str(local_file_path),
+                    self.s3_bucket,
+                    s3_key,
+                    ExtraArgs=extra_args,
+                    Config=self._transfer_config,
+                )
             logger.debug(f"Uploaded {local_path} to s3://{self.s3_bucket}/{s3_key}")
         except ClientError as e:
             raise RuntimeError(f"Failed to upload {local_path} to S3: {e}")
 
-    def _upload_content(self, content: str, s3_key: str, content_type: str) -> None:
-        """Upload string content directly to S3."""
+    def _is_unchanged(self, s3_key: str, size: int, digest: str) -> bool:
+        """Check whether S3 already holds an object with this size and SHA-256."""
+        try:
+            response = self.s3_client.head_object(Bucket=self.s3_bucket, Key=s3_key)
+        except ClientError:
+            return False
+
+        return bool(
+            response.get("ContentLength") == size
+            and response.get("Metadata", {}).get(_SHA256_METADATA_KEY) == digest
+        )
+
+    def _upload_content(self, content: bytes, s3_key: str, content_type: str) -> None:
+        """Upload in-memory content directly to S3."""
         if self.dry_run:
             logger.info(
                 f"DRY RUN: Would upload content to s3://{self.s3_bucket}/{s3_key}"
@@ -168,12 +286,22 @@ class S3Publisher(Publisher):
             return
 
         try:
-            self.s3_client.put_object(
-                Bucket=self.s3_bucket,
-                Key=s3_key,
-                Body=content,
-                ContentType=content_type,
-            )
+            if len(content) > _MULTIPART_THRESHOLD:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(content),
+                    self.s3_bucket,
+                    s3_key,
+                    ExtraArgs={"ContentType": content_type, **self._checksum_args},
+                    Config=self._transfer_config,
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=self.s3_bucket,
+                    Key=s3_key,
+                    Body=content,
+                    ContentType=content_type,
+                    **self._checksum_args,
+                )
             logger.debug(f"Uploaded content to s3://{self.s3_bucket}/{s3_key}")
         except ClientError as e:
             raise RuntimeError(f"Failed to upload content to S3: {e}")
@@ -190,8 +318,11 @@ class S3Publisher(Publisher):
             layout = CanonicalLayout(plan.job_id)
 
             collection_verified = self._verify_collection(plan, layout)
-            items_verified = self._verify_items(plan, layout)
-            cogs_verified = self._verify_primary_cogs(plan, layout)
+            with ThreadPoolExecutor(
+                max_workers=self.config.upload_concurrency
+            ) as executor:
+                items_verified = self._verify_items(plan, layout, executor)
+                cogs_verified = self._verify_primary_cogs(plan, layout, executor)
 
             pmtiles_verified = True
             if plan.pmtiles_path:
@@ -243,62 +374,73 @@ class S3Publisher(Publisher):
             logger.error(f"Collection verification failed: {e}")
             return False
 
-    def _verify_items(self, plan: PublishPlan, layout: CanonicalLayout) -> bool:
+    def _verify_items(
+        self, plan: PublishPlan, layout: CanonicalLayout, executor: Executor
+    ) -> bool:
         """Verify all item JSONs exist and are valid."""
-        for item in plan.items:
-            item_key = layout.item_path(item.item_id)
-
-            try:
-                response = self.s3_client.get_object(
-                    Bucket=self.s3_bucket, Key=item_key
-                )
-                item_data = json.loads(response["Body"].read().decode("utf-8"))
+        return all(
+            executor.map(lambda item: self._verify_item(item, layout), plan.items)
+        )
 
-                if item_data.get("type") != "Feature":
-                    logger.error(f"Item {item.item_id} JSON missing type=Feature")
-                    return False
+    def _verify_item(self, item: PublishItem, layout: CanonicalLayout) -> bool:
+        """Verify a single item JSON exists and is valid."""
+        item_key = layout.item_path(item.item_id)
 
-                if item_data.get("id") != item.item_id:
-                    logger.error(
-                        f"Item ID mismatch: expected {item.item_id}, got {item_data.get('id')}"
-                    )
-                    return False
+        try:
+            response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=item_key)
+            item_data = json.loads(response["Body"].read().decode("utf-8"))
 
-                assets = item_data.get("assets", {})
-                primary_assets = [
-                    asset
-                    for asset in assets.values()
-                    if isinstance(asset.get("roles"), list)
-                    and "primary" in asset["roles"]
-                ]
+            if item_data.get("type") != "Feature":
+                logger.error(f"Item {item.item_id} JSON missing type=Feature")
+                return False
 
-                if not primary_assets:
-                    logger.error(f"Item {item.item_id} missing primary asset")
-                    return False
+            if item_data.get("id") != item.item_id:
+                logger.error(
+                    f"Item ID mismatch: expected {item.item_id}, got {item_data.get('id')}"
+                )
+                return False
 
-                logger.debug(f"Item verification passed: {item_key}")
+            assets = item_data.get("assets", {})
+            primary_assets = [
+                asset
+                for asset in assets.values()
+                if isinstance(asset.get("roles"), list) and "primary" in asset["roles"]
+            ]
 
-            except ClientError as e:
-                logger.error(f"Item {item.item_id} verification failed: {e}")
+            if not primary_assets:
+                logger.error(f"Item {item.item_id} missing primary asset")
                 return False
 
-        return True
+            logger.debug(f"Item verification passed: {item_key}")
+            return True
 
-    def _verify_primary_cogs(self, plan: PublishPlan, layout: CanonicalLayout) -> bool:
+        except ClientError as e:
+            logger.error(f"Item {item.item_id} verification failed: {e}")
+            return False
+
+    def _verify_primary_cogs(
+        self, plan: PublishPlan, layout: CanonicalLayout, executor: Executor
+    ) -> bool:
         """Verify all primary COG files exist in S3."""
-        for item in plan.items:
-            primary_asset = item.analyzer_output.primary_cog_asset
-            cog_s3_key = layout.asset_path(item.item_id, primary_asset.key)
+        return all(
+            executor.map(
+                lambda item: self._verify_primary_cog(item, layout), plan.items
+            )
+        )
 
-            try:
-                self.s3_client.head_object(Bucket=self.s3_bucket, Key=cog_s3_key)
-                logger.debug(f"Primary COG verification passed: {cog_s3_key}")
+    def _verify_primary_cog(self, item: PublishItem, layout: CanonicalLayout) -> bool:
+        """Verify a single item's primary COG file exists in S3."""
+        primary_asset = item.analyzer_output.primary_cog_asset
+        cog_s3_key = layout.asset_path(item.item_id, primary_asset.key)
 
-            except ClientError as e:
-                logger.error(f"Primary COG {cog_s3_key} verification failed: {e}")
-                return False
+        try:
+            self.s3_client.head_object(Bucket=self.s3_bucket, Key=cog_s3_key)
+            logger.debug(f"Primary COG verification passed: {cog_s3_key}")
+            return True
 
-        return True
+        except ClientError as e:
+            logger.error(f"Primary COG {cog_s3_key} verification failed: {e}")
+            return False
 
     def _verify_pmtiles(self, layout: CanonicalLayout) -> bool:
         """Verify PMTiles file exists in S3."""
@@ -344,7 +486,7 @@ class LocalPublisher(Publisher):
 
     def _copy_assets(self, plan: PublishPlan, layout: CanonicalLayout) -> None:
         """Copy all assets to local directory using canonical layout."""
-        import shutil
+        copies: List[Tuple[Path, Path]] = []
 
         for item in plan.items:
             primary_asset = item.analyzer_output.primary_cog_asset
@@ -357,8 +499,7 @@ class LocalPublisher(Publisher):
                 source_path = Path(primary_asset.href)
                 dest_filename = f"{primary_asset.key}{source_path.suffix}"
                 dest = self.output_dir / layout.asset_path(item.item_id, dest_filename)
-                shutil.copy2(primary_asset.href, dest)
-                logger.debug(f"Copied {primary_asset.href} to {dest}")
+                copies.append((source_path, dest))
 
             if item.analyzer_output.additional_assets:
                 for asset in item.analyzer_output.additional_assets:
@@ -382,30 +523,31 @@ class LocalPublisher(Publisher):
                             dest = self.output_dir / layout.asset_path(
                                 item.item_id, dest_filename
                             )
-                        shutil.copy2(asset.href, dest)
-                        logger.debug(f"Copied {asset.href} to {dest}")
+                        copies.append((Path(asset.href), dest))
+
+        work_dirs = _resolve_work_dirs(plan)
+        with ThreadPoolExecutor(max_workers=_LOCAL_COPY_WORKERS) as executor:
+            list(
+                executor.map(
+                    lambda copy: _fast_copy(copy[0], copy[1], work_dirs), copies
+                )
+            )
 
     def _write_stac_files(self, stac_data: Dict[str, Any]) -> None:
         """Write STAC files to local filesystem."""
         collection_path = Path(stac_data["collection"]["path"])
-        collection_obj = stac_data["collection"]["object"]
 
         collection_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(collection_path, "w") as f:
-            json.dump(collection_obj.to_dict(), f, indent=2)
+        collection_path.write_bytes(_serialize_stac(stac_data["collection"]["dict"]))
 
         for item_data in stac_data["items"]:
             item_path = Path(item_data["path"])
-            item_obj = item_data["object"]
 
             item_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(item_path, "w") as f:
-                json.dump(item_obj.to_dict(), f, indent=2)
+            item_path.write_bytes(_serialize_stac(item_data["dict"]))
 
     def _copy_pmtiles(self, plan: PublishPlan, layout: CanonicalLayout) -> None:
         """Copy PMTiles to local directory."""
-        import shutil
-
         pmtiles_dir = self.output_dir / layout.pmtiles_root
         pmtiles_dir.mkdir(parents=True, exist_ok=True)
 
@@ -415,9 +557,11 @@ class LocalPublisher(Publisher):
 
         source_path = Path(plan.pmtiles_path)
         if source_path.exists():
-            dest_path = self.output_dir / layout.pmtiles_path
-            shutil.copy2(source_path, dest_path)
-            logger.debug(f"Copied PMTiles {source_path} to {dest_path}")
+            _fast_copy(
+                source_path,
+                self.output_dir / layout.pmtiles_path,
+                _resolve_work_dirs(plan),
+            )
 
     def verify_publication(self, plan: PublishPlan) -> bool:
         """Verify that files were written correctly to local filesystem."""
@@ -440,6 +584,47 @@ class LocalPublisher(Publisher):
         return True
 
 
+def _fast_copy(source: Path, dest: Path, work_dirs: Sequence[Path] = ()) -> None:
+    """
+    Place a copy of source at dest as cheaply as is safe.
+
+    Files under work_dirs, the directories the pipeline created for analyzer
+    and PMTiles output, are hard-linked when source and dest share a
+    filesystem. Anything else, like a plugin href to persistent data, is
+    copied with shutil.copyfile (sendfile/fcopyfile where available) and
+    keeps its mode bits, so the output never shares an inode with it.
+
+    Raises shutil.SameFileError if dest already is source, unless it is a
+    pipeline file that an earlier publish linked there.
+    """
+    resolved = source.resolve()
+    pipeline_owned = any(resolved.is_relative_to(d) for d in work_dirs)
+    if dest.exists() and os.path.samefile(source, dest):
+        if pipeline_owned:
+            return
+        raise shutil.SameFileError(f"{source} and {dest} are the same file")
+
+    # Replace rather than write through dest, which may be a hard link
+    dest.unlink(missing_ok=True)
+    if pipeline_owned:
+        try:
+            os.link(source, dest)
+        except OSError:
+            pass
+        else:
+            logger.debug(f"Linked {source} to {dest}")
+            return
+
+    shutil.copyfile(source, dest)
+    shutil.copymode(source, dest)
+    logger.debug(f"Copied {source} to {dest}")
+
+
+def _resolve_work_dirs(plan: PublishPlan) -> List[Path]:
+    """Resolve the plan's pipeline-owned directories for prefix checks."""
+    return [Path(work_dir).resolve() for work_dir in plan.work_dirs]
+
+
 def create_publisher(
     config: GeoExhibitConfig,
     local_out_dir: Optional[Path] = None,
@@ -1,13 +1,25 @@
 """STAC writing functionality with strict HREF rules enforcement."""
 
+import functools
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import jsonschema
+import numpy as np
+import numpy.typing as npt
+import orjson
 import pystac
 from pystac.extensions.projection import ProjectionExtension
 from pystac.extensions.raster import RasterExtension
-from shapely.geometry import shape
+from pystac.validation.schema_uri_map import DefaultSchemaUriMap
+from pystac.validation.stac_validator import STACValidator
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT7
 
 try:
     from pystac.extensions.processing import ProcessingExtension
@@ -23,6 +35,67 @@ from .publish_plan import PublishPlan, PublishItem
 
 logger = logging.getLogger(__name__)
 
+# Workers used to build and validate the items of one catalog
+_STAC_WORKERS = 8
+
+# STAC core, GeoJSON and extension JSON schemas shipped for offline validation
+_SCHEMAS_DIR = Path(__file__).parent / "schemas"
+
+# Media type for primary assets whose analyzer did not set one
+_COG_MEDIA_TYPE = "image/tiff; application=geotiff; profile=cloud-optimized"
+
+
+def _serialize_stac(stac_dict: Dict[str, Any]) -> bytes:
+    """Serialize a STAC object dict to indented UTF-8 JSON."""
+    return orjson.dumps(
+        stac_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _add_item_projection(item: pystac.Item) -> None:
+    """Add the projection extension to an item with its EPSG code."""
+    ProjectionExtension.add_to(item)
+    ProjectionExtension.ext(item).epsg = 4326
+
+
+@functools.lru_cache(maxsize=None)
+def _extension_hooks(
+    ext_names: Tuple[str, ...], for_item: bool
+) -> Tuple[Callable[[Any], None], ...]:
+    """
+    Resolve configured extension names to the functions that apply them.
+
+    The names are fixed for a run, so they are matched once rather than for
+    every collection and item.
+    """
+    hooks: List[Callable[[Any], None]] = []
+    for ext_name in ext_names:
+        if ext_name == "proj":
+            hooks.append(
+                _add_item_projection if for_item else ProjectionExtension.add_to
+            )
+        elif ext_name == "raster":
+            hooks.append(RasterExtension.add_to)
+        elif ext_name == "processing" and PROCESSING_EXTENSION_AVAILABLE:
+            hooks.append(ProcessingExtension.add_to)
+    return tuple(hooks)
+
+
+@dataclass(frozen=True, slots=True)
+class _ItemOptions:
+    """Config-derived settings read by create_stac_item, resolved once per run."""
+
+    geometry_in_item: bool
+    extension_hooks: Tuple[Callable[[Any], None], ...]
+
+    @classmethod
+    def from_config(cls, config: GeoExhibitConfig) -> "_ItemOptions":
+        """Resolve item settings from the configuration."""
+        return cls(
+            geometry_in_item=config.stac.get("geometry_in_item", True),
+            extension_hooks=_extension_hooks(tuple(config.use_extensions), True),
+        )
+
 
 def _fix_item_link_hrefs(item_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Fix item link hrefs to use proper relative paths instead of resolved absolute paths."""
@@ -60,16 +133,20 @@ class HrefResolver:
     - All other HREFs: strictly relative paths within the canonical structure
     """
 
+    __slots__ = ("config", "layout", "s3_bucket", "_cog_href_prefix")
+
     def __init__(self, config: GeoExhibitConfig, layout: CanonicalLayout):
         """Initialize with configuration and canonical layout."""
         self.config = config
         self.layout = layout
         self.s3_bucket = config.s3_bucket
+        # HREF prefixes are fixed per job, so only the item-specific tail is
+        # formatted per asset
+        self._cog_href_prefix = f"s3://{self.s3_bucket}/{layout.assets_root}"
 
     def resolve_cog_asset_href(self, item_id: str, asset_name: str) -> str:
         """Resolve COG asset HREF to fully qualified S3 URL."""
-        s3_key = self.layout.asset_path(item_id, asset_name)
-        return f"s3://{self.s3_bucket}/{s3_key}"
+        return f"{self._cog_href_prefix}{item_id}/{asset_name}"
 
     def resolve_thumbnail_href(self, item_id: str, thumb_name: str) -> str:
         """Resolve thumbnail HREF to relative path."""
@@ -80,24 +157,38 @@ class HrefResolver:
         return "../pmtiles/features.pmtiles"
 
 
+def _plan_item_bounds(plan: PublishPlan) -> npt.NDArray[np.float64]:
+    """Compute an (N, 4) array of item geometry bounds in batched GEOS calls."""
+    import shapely
+
+    # Parse and measure every geometry in a single vectorized GEOS call each
+    # rather than building one shapely object per item in Python.
+    geometries = shapely.from_geojson(
+        [orjson.dumps(item.geometry) for item in plan.items]
+    )
+    bounds: npt.NDArray[np.float64] = shapely.bounds(geometries)
+    return bounds
+
+
 def create_stac_collection(
-    plan: PublishPlan, config: GeoExhibitConfig, layout: CanonicalLayout
+    plan: PublishPlan,
+    config: GeoExhibitConfig,
+    layout: CanonicalLayout,
+    item_bounds: Optional[npt.NDArray[np.float64]] = None,
+    href_resolver: Optional[HrefResolver] = None,
 ) -> pystac.Collection:
-    """Create a STAC Collection from the publish plan."""
-    start_times = [item.timespan.start for item in plan.items]
-    end_times = [
-        item.timespan.end if item.timespan.end else item.timespan.start
-        for item in plan.items
-    ]
-
-    temporal_extent = pystac.TemporalExtent([[min(start_times), max(end_times)]])
+    """
+    Create a STAC Collection from the publish plan.
 
-    all_geometries = [shape(item.geometry) for item in plan.items]
+    item_bounds and href_resolver may carry the plan's precomputed per-item
+    bounds and shared resolver so they can be reused by create_stac_item.
+    """
+    start_time, end_time = plan.time_range
+    temporal_extent = pystac.TemporalExtent([[start_time, end_time]])
 
-    min_x = min(geom.bounds[0] for geom in all_geometries)
-    min_y = min(geom.bounds[1] for geom in all_geometries)
-    max_x = max(geom.bounds[2] for geom in all_geometries)
-    max_y = max(geom.bounds[3] for geom in all_geometries)
+    bounds = _plan_item_bounds(plan) if item_bounds is None else item_bounds
+    min_x, min_y = bounds[:, :2].min(axis=0).tolist()
+    max_x, max_y = bounds[:, 2:].max(axis=0).tolist()
 
     spatial_extent = pystac.SpatialExtent([[min_x, min_y, max_x, max_y]])
     extent = pystac.Extent(spatial=spatial_extent, temporal=temporal_extent)
@@ -114,17 +205,13 @@ def create_stac_collection(
         extra_fields=collection_metadata.get("extra_fields", {}),
     )
 
-    for ext_name in config.use_extensions:
-        if ext_name == "proj":
-            ProjectionExtension.add_to(collection)
-        elif ext_name == "raster":
-            RasterExtension.add_to(collection)
-        elif ext_name == "processing" and PROCESSING_EXTENSION_AVAILABLE:
-            ProcessingExtension.add_to(collection)
+    for add_extension in _extension_hooks(tuple(config.use_extensions), False):
+        add_extension(collection)
 
     # Only add PMTiles link if PMTiles are included in the plan
     if hasattr(plan, "pmtiles_path") and plan.pmtiles_path:
-        href_resolver = HrefResolver(config, layout)
+        if href_resolver is None:
+            href_resolver = HrefResolver(config, layout)
         pmtiles_href = href_resolver.resolve_pmtiles_href()
         pmtiles_link = pystac.Link(
             rel="pmtiles",
@@ -142,46 +229,56 @@ def create_stac_item(
     collection: pystac.Collection,
     config: GeoExhibitConfig,
     layout: CanonicalLayout,
+    href_resolver: Optional[HrefResolver] = None,
+    bbox: Optional[List[float]] = None,
+    options: Optional[_ItemOptions] = None,
 ) -> pystac.Item:
-    """Create a STAC Item from a PublishItem."""
+    """
+    Create a STAC Item from a PublishItem.
+
+    Callers building many items for one plan can pass a shared href_resolver,
+    the item's precomputed bbox and options resolved once from config;
+    otherwise they are derived from config, layout and the item geometry.
+    """
+    if options is None:
+        options = _ItemOptions.from_config(config)
+
     geometry = publish_item.geometry
-    geom_shape = shape(geometry)
-    bbox = list(geom_shape.bounds)
+    if bbox is None:
+        from shapely.geometry import shape
+
+        bbox = list(shape(geometry).bounds)
 
     timespan = publish_item.timespan
-    if timespan.is_instant:
-        datetime_val = timespan.start
+    start, end = timespan.start, timespan.end
+    if end is None:
+        datetime_val = start
         start_datetime = None
         end_datetime = None
     else:
         datetime_val = None
-        start_datetime = timespan.start
-        end_datetime = timespan.end
+        start_datetime = start
+        end_datetime = end
 
+    # The constructor takes ownership of the properties dict and stamps the
+    # interval bounds into it directly, so no second pass through
+    # common_metadata is needed.
     item = pystac.Item(
         id=publish_item.item_id,
-        geometry=geometry if config.stac.get("geometry_in_item", True) else None,
+        geometry=geometry if options.geometry_in_item else None,
         bbox=bbox,
         datetime=datetime_val,
-        properties=publish_item.properties,
+        properties=dict(publish_item.properties),
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
         collection=collection.id,
     )
 
-    if not timespan.is_instant:
-        item.common_metadata.start_datetime = start_datetime
-        item.common_metadata.end_datetime = end_datetime
+    for add_extension in options.extension_hooks:
+        add_extension(item)
 
-    for ext_name in config.use_extensions:
-        if ext_name == "proj":
-            ProjectionExtension.add_to(item)
-            proj_ext = ProjectionExtension.ext(item)
-            proj_ext.epsg = 4326
-        elif ext_name == "raster":
-            RasterExtension.add_to(item)
-        elif ext_name == "processing" and PROCESSING_EXTENSION_AVAILABLE:
-            ProcessingExtension.add_to(item)
-
-    href_resolver = HrefResolver(config, layout)
+    if href_resolver is None:
+        href_resolver = HrefResolver(config, layout)
     analyzer_output = publish_item.analyzer_output
 
     primary_asset = analyzer_output.primary_cog_asset
@@ -191,42 +288,37 @@ def create_stac_item(
 
     # Use the roles as specified by the analyzer - don't force add "data" and "primary"
     # The analyzer should set the appropriate roles for the intended use case
-    primary_roles = list(primary_asset.roles or ["primary"])
-
-    # Ensure "primary" role is present for TiTiler compatibility
+    # Ensure "primary" role is present for TiTiler compatibility. The spec's
+    # roles list is shared, like additional assets' roles, and only copied
+    # when the role has to be added.
+    primary_roles = primary_asset.roles or ["primary"]
     if "primary" not in primary_roles:
-        primary_roles.append("primary")
+        primary_roles = [*primary_roles, "primary"]
 
+    # pystac.Asset stores its arguments without copying and already maps a
+    # missing extra_fields to {}, so the specs' values are passed through
     pystac_asset = pystac.Asset(
         href=primary_href,
         title=primary_asset.title,
         description=primary_asset.description,
-        media_type=primary_asset.media_type
-        or "image/tiff; application=geotiff; profile=cloud-optimized",
+        media_type=primary_asset.media_type or _COG_MEDIA_TYPE,
         roles=primary_roles,
-        extra_fields=primary_asset.extra_fields or {},
+        extra_fields=primary_asset.extra_fields,
     )
 
     item.add_asset(primary_asset.key, pystac_asset)
 
     if analyzer_output.additional_assets:
         for asset_spec in analyzer_output.additional_assets:
-            if "thumbnail" in (asset_spec.roles or []):
-                asset_href = href_resolver.resolve_thumbnail_href(
-                    publish_item.item_id, asset_spec.key
-                )
-            else:
-                asset_href = href_resolver.resolve_thumbnail_href(
-                    publish_item.item_id, asset_spec.key
-                )
-
             additional_asset = pystac.Asset(
-                href=asset_href,
+                href=href_resolver.resolve_thumbnail_href(
+                    publish_item.item_id, asset_spec.key
+                ),
                 title=asset_spec.title,
                 description=asset_spec.description,
                 media_type=asset_spec.media_type,
                 roles=asset_spec.roles,
-                extra_fields=asset_spec.extra_fields or {},
+                extra_fields=asset_spec.extra_fields,
             )
 
             item.add_asset(asset_spec.key, additional_asset)
@@ -235,12 +327,30 @@ def create_stac_item(
 
 
 def write_stac_catalog(
-    plan: PublishPlan, config: GeoExhibitConfig, output_dir: Optional[Path] = None
+    plan: PublishPlan,
+    config: GeoExhibitConfig,
+    output_dir: Optional[Path] = None,
+    validate: bool = True,
 ) -> Dict[str, Any]:
-    """Write complete STAC catalog for the publish plan."""
+    """
+    Write complete STAC catalog for the publish plan.
+
+    The collection and every item in the result carry the dict built for
+    them under "dict", so publishers can serialize it without another
+    to_dict call.
+
+    With validate=False schema validation is skipped and the result carries
+    a "validate" callable instead, so callers can run it off the critical
+    path (for example on a worker thread while uploads proceed).
+    """
     layout = CanonicalLayout(plan.job_id)
 
-    collection = create_stac_collection(plan, config, layout)
+    # Geometry bounds feed both the collection extent and every item bbox
+    item_bounds = _plan_item_bounds(plan)
+    href_resolver = HrefResolver(config, layout)
+    collection = create_stac_collection(
+        plan, config, layout, item_bounds, href_resolver
+    )
 
     # Add self link to collection to prevent null href issues
     collection_self_link = pystac.Link(
@@ -260,10 +370,24 @@ def write_stac_catalog(
     )
     collection.add_link(collection_root_link)
 
-    items = []
-    for publish_item in plan.items:
-        item = create_stac_item(publish_item, collection, config, layout)
-        items.append(item)
+    item_options = _ItemOptions.from_config(config)
+    with ThreadPoolExecutor(max_workers=_STAC_WORKERS) as executor:
+        # Items only read the collection, so they can be built independently
+        items = list(
+            executor.map(
+                lambda publish_item, bbox: create_stac_item(
+                    publish_item,
+                    collection,
+                    config,
+                    layout,
+                    href_resolver,
+                    bbox,
+                    item_options,
+                ),
+                plan.items,
+                item_bounds.tolist(),
+            )
+        )
 
     # Manually create item links in collection with proper relative hrefs
     # This prevents PySTAC from creating null hrefs in automatic links
@@ -312,79 +436,254 @@ def write_stac_catalog(
         )
         item.add_link(self_link)
 
+    # Build each object's dict once; the same dicts are written and validated
+    collection_dict = collection.to_dict()
+    # Fix item links to have proper relative hrefs in the JSON output
+    item_dicts = [_fix_item_link_hrefs(item.to_dict()) for item in items]
+
     if output_dir:
         job_dir = output_dir / f"jobs/{plan.job_id}"
         stac_dir = job_dir / "stac"
         items_dir = stac_dir / "items"
 
-        stac_dir.mkdir(parents=True, exist_ok=True)
+        # Creating the items directory also creates the STAC directory
         items_dir.mkdir(parents=True, exist_ok=True)
 
-        collection_path = stac_dir / "collection.json"
-        item_paths = [items_dir / f"{item.id}.json" for item in items]
+        collection_path = str(stac_dir / "collection.json")
+        # Item paths are plain string joins rather than one Path per item
+        items_prefix = f"{items_dir}{os.sep}"
+        item_paths = [f"{items_prefix}{item.id}.json" for item in items]
 
         # Actually write files to disk when output_dir is provided
-        import json
+        with open(collection_path, "wb") as f:
+            f.write(_serialize_stac(collection_dict))
 
-        with open(collection_path, "w", encoding="utf-8") as f:
-            json.dump(collection.to_dict(), f, indent=2)
-
-        for item, item_path in zip(items, item_paths):
-            with open(item_path, "w", encoding="utf-8") as f:
-                # Fix item links to have proper relative hrefs in the JSON output
-                item_dict = _fix_item_link_hrefs(item.to_dict())
-                json.dump(item_dict, f, indent=2)
+        for item_dict, item_path in zip(item_dicts, item_paths):
+            with open(item_path, "wb") as f:
+                f.write(_serialize_stac(item_dict))
     else:
-        collection_path = Path(layout.collection_path)
-        item_paths = [Path(layout.item_path(item.id)) for item in items]
+        collection_path = layout.collection_path
+        item_paths = [layout.item_path(item.id) for item in items]
 
-    _validate_stac_collection(collection)
-    for item in items:
-        _validate_stac_item(item, config)
+    validate_catalog = functools.partial(
+        _validate_stac_catalog, collection, collection_dict, items, item_dicts, config
+    )
+    if validate:
+        validate_catalog()
 
     logger.info(f"Generated STAC catalog with {len(items)} items")
 
-    return {
-        "collection": {"path": str(collection_path), "object": collection},
+    result = {
+        "collection": {
+            "path": collection_path,
+            "object": collection,
+            "dict": collection_dict,
+        },
         "items": [
-            {"path": str(path), "object": item} for path, item in zip(item_paths, items)
+            {"path": path, "object": item, "dict": item_dict}
+            for path, item, item_dict in zip(item_paths, items, item_dicts)
         ],
         "job_id": plan.job_id,
         "collection_id": plan.collection_id,
         "layout": layout,
     }
+    if not validate:
+        result["validate"] = validate_catalog
+    return result
+
+
+def _validate_stac_catalog(
+    collection: pystac.Collection,
+    collection_dict: Dict[str, Any],
+    items: List[pystac.Item],
+    item_dicts: List[Dict[str, Any]],
+    config: GeoExhibitConfig,
+) -> None:
+    """Validate a collection and its items concurrently from their dicts."""
+    with ThreadPoolExecutor(max_workers=_STAC_WORKERS) as executor:
+        collection_validation = executor.submit(
+            _validate_stac_collection, collection, collection_dict
+        )
+        item_validations = executor.map(
+            lambda item, item_dict: _validate_stac_item(item, config, item_dict),
+            items,
+            item_dicts,
+        )
+        # Surface collection errors first, then the first invalid item
+        collection_validation.result()
+        list(item_validations)
+
+
+class _BundledSchemaValidator(STACValidator):
+    """
+    STAC validator that checks dicts against the JSON schemas GeoExhibit ships.
+
+    Built on jsonschema and a referencing registry of the schemas in
+    geoexhibit/schemas (STAC core, GeoJSON and the proj, raster and
+    processing extensions), keyed by the URI each file mirrors. Every
+    schema is compiled once and shared by the threads validating a catalog.
+    Schemas that are not bundled, such as extensions added by plugins, are
+    fetched with pystac's StacIO, logged, and cached.
+    """
+
+    def __init__(self) -> None:
+        self._schema_uri_map = DefaultSchemaUriMap()
+        self._schemas = _bundled_schemas()
+        # mypy does not see the attrs alias for Registry's retrieve field
+        registry: Registry[Any] = Registry(
+            retrieve=self._retrieve  # type: ignore[call-arg]
+        )
+        self._registry = registry.with_resources(
+            (uri, Resource.from_contents(schema, default_specification=DRAFT7))
+            for uri, schema in self._schemas.items()
+        )
+        self._compiled: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def validate_core(
+        self,
+        stac_dict: Dict[str, Any],
+        stac_object_type: pystac.STACObjectType,
+        stac_version: str,
+        href: Optional[str] = None,
+    ) -> Optional[str]:
+        schema_uri = self._schema_uri_map.get_object_schema_uri(
+            stac_object_type, stac_version
+        )
+        if schema_uri is None:
+            return None
+        self._validate_from_uri(stac_dict, stac_object_type, schema_uri, href)
+        return schema_uri
+
+    def validate_extension(
+        self,
+        stac_dict: Dict[str, Any],
+        stac_object_type: pystac.STACObjectType,
+        stac_version: str,
+        extension_id: str,
+        href: Optional[str] = None,
+    ) -> Optional[str]:
+        self._validate_from_uri(stac_dict, stac_object_type, extension_id, href)
+        return extension_id
+
+    def _validate_from_uri(
+        self,
+        stac_dict: Dict[str, Any],
+        stac_object_type: pystac.STACObjectType,
+        schema_uri: str,
+        href: Optional[str],
+    ) -> None:
+        validator = self._compiled.get(schema_uri)
+        if validator is None:
+            # Items are validated on a pool; compile each schema on one thread
+            with self._lock:
+                validator = self._compiled.get(schema_uri)
+                if validator is None:
+                    schema = self._get_schema(schema_uri)
+                    validator_cls = jsonschema.validators.validator_for(schema)
+                    validator_cls.check_schema(schema)
+                    validator = validator_cls(schema, registry=self._registry)
+                    self._compiled[schema_uri] = validator
+
+        errors = list(validator.iter_errors(stac_dict))
+        if errors:
+            msg = f"Validation failed for {stac_object_type} "
+            if href is not None:
+                msg += f"at {href} "
+            if stac_dict.get("id") is not None:
+                msg += f"with ID {stac_dict['id']} "
+            msg += f"against schema at {schema_uri}"
+            best = jsonschema.exceptions.best_match(errors)
+            if best:
+                msg += f"\n{best}"
+            raise pystac.STACValidationError(msg, source=errors) from best
+
+    def _get_schema(self, schema_uri: str) -> Dict[str, Any]:
+        """Get a bundled schema, fetching and caching any other one."""
+        schema = self._schemas.get(schema_uri)
+        if schema is None:
+            logger.warning(f"STAC schema {schema_uri} is not bundled; fetching it")
+            schema = orjson.loads(pystac.StacIO.default().read_text(schema_uri))
+            self._schemas[schema_uri] = schema
+        return schema
+
+    def _retrieve(self, schema_uri: str) -> Resource[Any]:
+        """Resolve a $ref to a schema outside the bundled registry."""
+        return Resource.from_contents(
+            self._get_schema(schema_uri), default_specification=DRAFT7
+        )
+
+
+def _bundled_schemas() -> Dict[str, Dict[str, Any]]:
+    """Load the JSON schemas shipped in geoexhibit/schemas, keyed by their URI."""
+    # Each file lives at the host and path of the URI it is published at
+    return {
+        f"https://{schema_path.relative_to(_SCHEMAS_DIR).as_posix()}": orjson.loads(
+            schema_path.read_bytes()
+        )
+        for schema_path in sorted(_SCHEMAS_DIR.rglob("*.json"))
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _stac_validator() -> _BundledSchemaValidator:
+    """Get the validator shared by every STAC object this process writes."""
+    return _BundledSchemaValidator()
 
 
-def _validate_stac_collection(collection: pystac.Collection) -> None:
-    """Validate STAC Collection."""
+def _validate_stac_dict(
+    stac_object: pystac.STACObject, stac_dict: Dict[str, Any]
+) -> None:
+    """Validate an already-built dict of a STAC object without another to_dict."""
+    pystac.validation.validate_dict(
+        stac_dict,
+        stac_object_type=stac_object.STAC_OBJECT_TYPE,
+        stac_version=pystac.get_stac_version(),
+        extensions=stac_object.stac_extensions,
+        href=stac_object.get_self_href(),
+        validator=_stac_validator(),
+    )
+
+
+def _validate_stac_collection(
+    collection: pystac.Collection, collection_dict: Optional[Dict[str, Any]] = None
+) -> None:
+    """Validate STAC Collection, optionally from its already-built dict."""
     try:
-        collection.validate()
+        if collection_dict is None:
+            collection_dict = collection.to_dict()
+        _validate_stac_dict(collection, collection_dict)
         logger.debug(f"STAC Collection {collection.id} is valid")
     except Exception as e:
         raise ValueError(f"Invalid STAC Collection: {e}")
 
 
-def _validate_stac_item(item: pystac.Item, config: GeoExhibitConfig) -> None:
+def _validate_stac_item(
+    item: pystac.Item,
+    config: GeoExhibitConfig,
+    item_dict: Optional[Dict[str, Any]] = None,
+) -> None:
     """Validate STAC Item and check for primary COG asset."""
     try:
-        item.validate()
+        if item_dict is None:
+            item_dict = item.to_dict()
+        _validate_stac_dict(item, item_dict)
         logger.debug(f"STAC Item {item.id} is valid")
 
-        primary_assets = [
-            asset
-            for asset in item.assets.values()
-            if asset.roles and "primary" in asset.roles
-        ]
+        # Single scan that stops as soon as a second primary asset is seen
+        primary_asset = None
+        for asset in item.assets.values():
+            if asset.roles and "primary" in asset.roles:
+                if primary_asset is not None:
+                    logger.warning(f"STAC Item {item.id} has multiple primary assets")
+                    break
+                primary_asset = asset
 
-        if not primary_assets:
+        if primary_asset is None:
             raise ValueError(
                 f"STAC Item {item.id} missing primary COG asset with 'primary' role"
             )
 
-        if len(primary_assets) > 1:
-            logger.warning(f"STAC Item {item.id} has multiple primary assets")
-
-        primary_asset = primary_assets[0]
         if not primary_asset.href.startswith("s3://"):
             raise ValueError(
                 f"Primary COG asset HREF must be fully qualified S3 URL: {primary_asset.href}"
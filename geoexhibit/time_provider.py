@@ -1,8 +1,11 @@
 """Time provider interface and implementations for GeoExhibit."""
 
+import functools
+import importlib
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, Any, Iterable
+from itertools import repeat
+from typing import Callable, Dict, Any, Iterable, Iterator, Sequence, Tuple
 
 from .timespan import TimeSpan
 
@@ -10,24 +13,84 @@ from .timespan import TimeSpan
 class TimeProvider(ABC):
     """Provider for extracting time information from features."""
 
+    __slots__ = ()
+
     @abstractmethod
     def for_feature(self, feature: Dict[str, Any]) -> Iterable[TimeSpan]:
         """Extract time spans for the given feature."""
         pass
 
+    def for_features(
+        self, features: Sequence[Dict[str, Any]]
+    ) -> Iterator[Iterable[TimeSpan]]:
+        """Extract time spans for each feature, in order.
+
+        Providers that can answer for a whole batch at once override this.
+        """
+        return map(self.for_feature, features)
+
 
 class ConstantTimeProvider(TimeProvider):
     """Demo time provider that returns a constant time for all features."""
 
+    __slots__ = ("datetime", "_time_spans")
+
     def __init__(self, dt: datetime):
         """Initialize with a constant datetime."""
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         self.datetime = dt
+        # Every feature gets the same span, so one immutable result is shared
+        self._time_spans = (TimeSpan(start=dt),)
 
-    def for_feature(self, feature: Dict[str, Any]) -> Iterable[TimeSpan]:
+    def for_feature(self, feature: Dict[str, Any]) -> Tuple[TimeSpan, ...]:
         """Return a single TimeSpan with the constant datetime."""
-        return [TimeSpan(start=self.datetime)]
+        return self._time_spans
+
+    def for_features(
+        self, features: Sequence[Dict[str, Any]]
+    ) -> Iterator[Tuple[TimeSpan, ...]]:
+        """Return the shared constant result once per feature."""
+        return repeat(self._time_spans, len(features))
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date as UTC midnight, slicing zero-padded fields."""
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        return datetime(
+            int(date_str[:4]),
+            int(date_str[5:7]),
+            int(date_str[8:]),
+            tzinfo=timezone.utc,
+        )
+    # strptime also accepts unpadded months and days
+    return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_provider_callable(
+    module_path: str, callable_name: str
+) -> Callable[[], Any]:
+    """Import and return a provider callable, caching successful lookups."""
+    module = importlib.import_module(module_path)
+    provider_callable: Callable[[], Any] = getattr(module, callable_name)
+
+    if not callable(provider_callable):
+        raise ValueError(f"{callable_name} is not callable")
+
+    return provider_callable
+
+
+def clear_provider_cache() -> None:
+    """Forget provider callables resolved by create_time_provider."""
+    _resolve_provider_callable.cache_clear()
 
 
 def create_time_provider(provider_spec: str) -> TimeProvider:
@@ -50,10 +113,10 @@ def create_time_provider(provider_spec: str) -> TimeProvider:
         date_str = provider_spec[9:]  # Remove "constant:" prefix
         try:
             if "T" in date_str:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                # fromisoformat accepts a trailing "Z" since Python 3.11
+                dt = datetime.fromisoformat(date_str)
             else:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                dt = dt.replace(tzinfo=timezone.utc)
+                dt = _parse_date(date_str)
             return ConstantTimeProvider(dt)
         except ValueError as e:
             raise ValueError(f"Invalid constant time format '{date_str}': {e}")
@@ -61,13 +124,7 @@ def create_time_provider(provider_spec: str) -> TimeProvider:
     elif ":" in provider_spec:
         try:
             module_path, callable_name = provider_spec.rsplit(":", 1)
-            import importlib
-
-            module = importlib.import_module(module_path)
-            provider_callable = getattr(module, callable_name)
-
-            if not callable(provider_callable):
-                raise ValueError(f"{callable_name} is not callable")
+            provider_callable = _resolve_provider_callable(module_path, callable_name)
 
             result = provider_callable()
             if not isinstance(result, TimeProvider):
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeSpan:
     """Represents a time span for analysis."""
 
@@ -4,6 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 from geoexhibit.config import (
     GeoExhibitConfig,
@@ -62,6 +63,21 @@ def test_load_config_file_not_found():
         pass
 
 
+def test_load_config_invalid_json():
+    """Test malformed JSON surfaces as a JSONDecodeError."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        f.write('{"project": {"name": NaN}}')
+        temp_path = Path(f.name)
+
+    try:
+        load_config(temp_path)
+        assert False, "Should have raised JSONDecodeError"
+    except json.JSONDecodeError:
+        pass
+    finally:
+        temp_path.unlink()
+
+
 def test_validate_config_missing_sections():
     """Test validation fails with missing required sections."""
     incomplete_config = {"project": {"name": "test"}}
@@ -97,6 +113,63 @@ def test_validate_aws_section():
         assert "Missing required AWS field: s3_bucket" in str(e)
 
 
+def test_validate_config_rejects_wrong_value_types():
+    """Test validation rejects non-string and non-list values up front."""
+    for section, field, value, message in [
+        ("project", "collection_id", 123, "collection_id must be a string"),
+        ("aws", "s3_bucket", None, "s3_bucket must be a string"),
+        ("stac", "use_extensions", "proj", "must be a list of strings"),
+        ("aws", "upload_concurrency", "16", "must be an integer"),
+        ("aws", "upload_concurrency", 0, "must be at least 1"),
+        ("aws", "checksum_algorithm", "MD5", "Invalid AWS checksum_algorithm"),
+        ("aws", "skip_unchanged", "yes", "skip_unchanged must be a boolean"),
+    ]:
+        base_config = _create_minimal_valid_config()
+        base_config[section][field] = value
+        try:
+            validate_config(base_config)
+            assert False, f"Should have raised ValueError for {section}.{field}"
+        except ValueError as e:
+            assert message in str(e)
+
+
+def test_validate_aws_crt_checksum_algorithms():
+    """Test CRC32C and CRC64NVME require the AWS CRT; CRC32 does not."""
+    for algorithm in ["CRC32C", "CRC64NVME"]:
+        base_config = _create_minimal_valid_config()
+        base_config["aws"]["checksum_algorithm"] = algorithm
+        with patch("botocore.compat.HAS_CRT", False):
+            try:
+                validate_config(base_config)
+                assert False, f"Should have raised ValueError for {algorithm}"
+            except ValueError as e:
+                assert "requires the AWS CRT" in str(e)
+
+        with patch("botocore.compat.HAS_CRT", True):
+            config = validate_config(base_config)
+        assert config.checksum_algorithm == algorithm
+
+    base_config = _create_minimal_valid_config()
+    base_config["aws"]["checksum_algorithm"] = "CRC32"
+    with patch("botocore.compat.HAS_CRT", False):
+        assert validate_config(base_config).checksum_algorithm == "CRC32"
+
+
+def test_validate_analyzer_concurrency():
+    """Test analyzer concurrency defaults to 1 and rejects invalid values."""
+    config = validate_config(_create_minimal_valid_config())
+    assert config.analyzer_concurrency == 1
+
+    for value, message in [("4", "must be an integer"), (0, "must be at least 1")]:
+        base_config = _create_minimal_valid_config()
+        base_config["analyzer"] = {"name": "demo", "concurrency": value}
+        try:
+            validate_config(base_config)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert message in str(e)
+
+
 def test_validate_time_section_invalid_mode():
     """Test time section validation with invalid mode."""
     base_config = _create_minimal_valid_config()
@@ -223,3 +296,14 @@ def _create_minimal_valid_config() -> Dict[str, Any]:
             "tz": "UTC",
         },
     }
+
+
+def test_create_default_config_returns_independent_copies():
+    """Test mutating one default config does not affect later ones."""
+    first = create_default_config()
+    first["aws"]["s3_bucket"] = "changed"
+    first["stac"]["use_extensions"].append("custom")
+
+    second = create_default_config()
+    assert second["aws"]["s3_bucket"] == "your-bucket-name"
+    assert second["stac"]["use_extensions"] == ["proj", "raster", "processing"]
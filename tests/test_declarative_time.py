@@ -151,6 +151,25 @@ def test_from_epoch_milliseconds():
     assert spans[0].start.hour == 12
 
 
+def test_from_epoch_string_and_invalid_values():
+    """Test epoch extractor with numeric strings and non-numeric values."""
+    config = {
+        "extractor": "from_epoch",
+        "field": "properties.timestamp",
+        "tz": "UTC",
+    }
+    provider = DeclarativeTimeProvider(config)
+
+    spans = list(provider.for_feature({"properties": {"timestamp": "1694779200000"}}))
+    assert len(spans) == 1
+    assert spans[0].start.day == 15
+    assert spans[0].start.hour == 12
+
+    for value in ["not a number", [1694779200], {"seconds": 1694779200}]:
+        feature = {"properties": {"timestamp": value}}
+        assert list(provider.for_feature(feature)) == []
+
+
 def test_regex_from_string_extractor():
     """Test extracting date from string using regex."""
     config = {
@@ -188,6 +207,23 @@ def test_regex_from_string_no_match():
     assert len(spans) == 0
 
 
+def test_regex_from_string_capture_group():
+    """Test a single capture group selects the date like re.findall did."""
+    config = {
+        "extractor": "regex_from_string",
+        "field": "properties.name",
+        "regex": {"pattern": r"fire_(\d{8})_final"},
+    }
+    provider = DeclarativeTimeProvider(config)
+
+    feature = {"properties": {"name": "fire_20230915_final"}}
+
+    spans = list(provider.for_feature(feature))
+    assert len(spans) == 1
+    assert spans[0].start.month == 9
+    assert spans[0].start.day == 15
+
+
 def test_nested_field_access():
     """Test accessing nested fields with dot notation."""
     config = {
@@ -256,6 +292,75 @@ def test_parse_datetime_custom_format():
     assert result.day == 15
 
 
+def test_parse_datetime_unpadded_and_invalid_values():
+    """Test values outside the fixed-width fast path still parse like strptime."""
+    provider = DeclarativeTimeProvider(
+        {"extractor": "attribute_date", "field": "properties.date", "format": "auto"}
+    )
+
+    result = provider._parse_datetime("2023-9-5")
+    assert result is not None
+    assert (result.year, result.month, result.day) == (2023, 9, 5)
+
+    assert provider._parse_datetime("2023-02-30") is None
+    assert provider._parse_datetime("not a date") is None
+
+    custom = DeclarativeTimeProvider(
+        {
+            "extractor": "attribute_date",
+            "field": "properties.date",
+            "format": "%d/%m/%Y",
+        }
+    )
+    result = custom._parse_datetime("5/9/2023")
+    assert result is not None
+    assert (result.year, result.month, result.day) == (2023, 9, 5)
+    assert custom._parse_datetime("31/02/2023") is None
+
+
+def test_parse_datetime_caches_repeated_values():
+    """Test repeated date strings are parsed once and caches can be cleared."""
+    from geoexhibit.declarative_time import _parse_datetime_string, clear_time_caches
+
+    clear_time_caches()
+    provider = DeclarativeTimeProvider(
+        {"extractor": "attribute_date", "field": "properties.date", "format": "auto"}
+    )
+
+    first = provider._parse_datetime("2023-09-15")
+    second = provider._parse_datetime("2023-09-15")
+
+    assert first == second
+    assert _parse_datetime_string.cache_info().hits == 1
+
+    clear_time_caches()
+    assert _parse_datetime_string.cache_info().currsize == 0
+
+
+def test_unsupported_extractor_rejected_at_construction():
+    """Test an unknown extractor fails when the provider is created."""
+    try:
+        DeclarativeTimeProvider({"extractor": "no_such_extractor"})
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Unsupported extractor" in str(e)
+
+
+def test_providers_use_slots():
+    """Test time providers keep their state in slots rather than a __dict__."""
+    from datetime import datetime, timezone
+
+    from geoexhibit.time_provider import ConstantTimeProvider
+
+    declarative = DeclarativeTimeProvider(
+        {"extractor": "attribute_date", "field": "properties.date"}
+    )
+    constant = ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc))
+
+    assert not hasattr(declarative, "__dict__")
+    assert not hasattr(constant, "__dict__")
+
+
 def test_create_declarative_time_provider_function():
     """Test the factory function for creating declarative providers."""
     config = {
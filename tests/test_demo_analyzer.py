@@ -6,8 +6,13 @@ from pathlib import Path
 
 import numpy as np
 import rasterio
+from rasterio.errors import RasterioError
 
-from geoexhibit.demo_analyzer import DemoAnalyzer, create_demo_analyzer
+from geoexhibit.demo_analyzer import (
+    DemoAnalyzer,
+    _cog_compression,
+    create_demo_analyzer,
+)
 from geoexhibit.timespan import TimeSpan
 
 
@@ -118,13 +123,28 @@ def test_demo_analyzer_cog_properties():
             # Test functional COG properties (tiled flag may not be reliable in all rasterio versions)
             assert src.profile["blockxsize"] == 256
             assert src.profile["blockysize"] == 256
-            assert src.profile["compress"] == "lzw"
+            # The bundled GDAL build writes ZSTD
+            assert src.profile["compress"] == "zstd"
             # Predictor may not always be reported in profile
             assert src.profile.get("predictor", 2) == 2
 
             assert len(src.overviews(1)) > 0
 
 
+def test_cog_compression_falls_back_to_lzw(monkeypatch):
+    """Test LZW is used when the GDAL build cannot write ZSTD."""
+
+    def unsupported_memory_file():
+        raise RasterioError("ZSTD codec not available")
+
+    monkeypatch.setattr("rasterio.io.MemoryFile", unsupported_memory_file)
+    _cog_compression.cache_clear()
+    try:
+        assert _cog_compression() == {"compress": "lzw"}
+    finally:
+        _cog_compression.cache_clear()
+
+
 def test_demo_analyzer_time_variation():
     """Test that analysis results vary with time (day of year factor)."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -162,6 +182,47 @@ def test_demo_analyzer_time_variation():
                 ), "Time variation should affect output"
 
 
+def test_demo_analyzer_synthetic_data_is_float32_and_masked():
+    """Test synthetic data is produced directly as clipped, masked float32."""
+    from shapely.geometry import Point
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = DemoAnalyzer(Path(temp_dir))
+        timespan = TimeSpan(start=datetime(2023, 9, 15, tzinfo=timezone.utc))
+
+        data = analyzer._generate_synthetic_data(
+            Point(0, 0), (-1.0, -1.0, 1.0, 1.0), 64, 32, timespan
+        )
+
+        assert data.dtype == np.float32
+        assert data.shape == (32, 64)
+        assert data[0, 0] == -9999  # corners are outside the 0.5 radius
+        valid = data[data != -9999]
+        assert len(valid) > 0
+        assert valid.min() >= -1 and valid.max() <= 1
+
+
+def test_demo_analyzer_reuses_spatial_pattern_across_timespans():
+    """Test a feature's timespans share one cached, read-only spatial grid."""
+    from shapely.geometry import Point
+
+    from geoexhibit.demo_analyzer import _spatial_pattern
+
+    _spatial_pattern.cache_clear()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = DemoAnalyzer(Path(temp_dir))
+        bounds = (-1.0, -1.0, 1.0, 1.0)
+
+        for month in (1, 7):
+            timespan = TimeSpan(start=datetime(2023, month, 1, tzinfo=timezone.utc))
+            analyzer._generate_synthetic_data(Point(0, 0), bounds, 32, 32, timespan)
+
+        assert _spatial_pattern.cache_info().hits == 1
+        pattern, outside = _spatial_pattern(bounds, 0.0, 0.0, 32, 32)
+        assert not pattern.flags.writeable
+        assert not outside.flags.writeable
+
+
 def test_demo_analyzer_feature_id_in_filename():
     """Test that feature ID appears in generated COG filename."""
     with tempfile.TemporaryDirectory() as temp_dir:
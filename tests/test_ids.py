@@ -0,0 +1,43 @@
+"""Tests for ULID generation helpers."""
+
+from unittest.mock import patch
+
+from geoexhibit.ids import new_ulids
+
+
+def test_new_ulids_count_and_uniqueness():
+    """Test a batch has the requested number of distinct 26-character IDs."""
+    ids = new_ulids(1000)
+
+    assert len(ids) == 1000
+    assert len(set(ids)) == 1000
+    assert all(len(ulid_str) == 26 for ulid_str in ids)
+
+
+def test_new_ulids_share_timestamp():
+    """Test every ID in a batch carries the same timestamp prefix."""
+    ids = new_ulids(10)
+
+    assert len({ulid_str[:10] for ulid_str in ids}) == 1
+
+
+def test_new_ulids_sorted_in_generation_order():
+    """Test a batch sorts in the order its IDs were generated."""
+    ids = new_ulids(1000)
+
+    assert ids == sorted(ids)
+
+
+def test_new_ulids_randomness_overflow_bumps_timestamp():
+    """Test incrementing past the largest random part carries into the timestamp."""
+    with patch("geoexhibit.ids.os.urandom", return_value=b"\xff" * 10):
+        ids = new_ulids(2)
+
+    assert ids == sorted(ids)
+    assert ids[0][:10] != ids[1][:10]
+    assert ids[1][10:] == "0" * 16
+
+
+def test_new_ulids_empty():
+    """Test requesting no IDs returns an empty list."""
+    assert new_ulids(0) == []
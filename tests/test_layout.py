@@ -54,3 +54,17 @@ def test_canonical_layout_with_ulid():
         item_path
         == "jobs/01ARZ3NDEKTSV4RRFFQ69G5FAV/stac/items/01ARZ3NDEKTSV4RRFFQ69G5FAX.json"
     )
+
+
+def test_canonical_layout_is_immutable():
+    """Test layout job_id cannot change after path prefixes are computed."""
+    layout = CanonicalLayout(job_id="test-job-123")
+
+    try:
+        layout.job_id = "other-job"  # type: ignore[misc]
+        assert False, "Should have raised FrozenInstanceError"
+    except AttributeError:
+        pass
+
+    assert layout == CanonicalLayout(job_id="test-job-123")
+    assert repr(layout) == "CanonicalLayout(job_id='test-job-123')"
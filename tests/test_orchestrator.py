@@ -1,10 +1,16 @@
 """Tests for orchestrator functionality."""
 
+import json
+import os
+import stat
 from datetime import datetime, timezone
 
 from geoexhibit.analyzer import AssetSpec, AnalyzerOutput, Analyzer
 from geoexhibit.config import GeoExhibitConfig, validate_config
-from geoexhibit.orchestrator import create_publish_plan
+from geoexhibit.orchestrator import (
+    _generate_pmtiles_from_features,
+    create_publish_plan,
+)
 from geoexhibit.time_provider import ConstantTimeProvider
 
 
@@ -120,6 +126,7 @@ def test_create_publish_plan_missing_feature_id():
     assert plan.item_count == 1
     feature_id = plan.items[0].feature_id
     assert len(feature_id) > 0  # Should have generated a feature_id
+    assert feature_id.startswith("test")  # Uses the configured ids.prefix
 
 
 def test_create_publish_plan_invalid_input():
@@ -144,6 +151,151 @@ def test_create_publish_plan_invalid_input():
         assert "empty" in str(e)
 
 
+def test_create_publish_plan_collects_geometry_types():
+    """Test collection metadata lists the distinct geometry types."""
+    features = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"feature_id": f"feat-{i}"},
+                "geometry": geometry,
+            }
+            for i, geometry in enumerate(
+                [
+                    {"type": "Point", "coordinates": [0, 0]},
+                    {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 1]]]},
+                    {"type": "Point", "coordinates": [1, 1]},
+                ]
+            )
+        ],
+    }
+
+    plan = create_publish_plan(
+        features,
+        TestAnalyzer(),
+        _create_test_config(),
+        ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc)),
+    )
+
+    assert plan.collection_metadata["feature_count"] == 3
+    assert plan.collection_metadata["geometry_types"] == ["Point", "Polygon"]
+
+
+def test_create_publish_plan_concurrent_analyzer_keeps_order():
+    """Test analyzer.concurrency runs the analyzer in parallel, in input order."""
+    features = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"feature_id": f"feat-{i}"},
+                "geometry": {"type": "Point", "coordinates": [i, i]},
+            }
+            for i in range(8)
+        ],
+    }
+
+    class FeatureHrefAnalyzer(TestAnalyzer):
+        def analyze(self, feature, timespan) -> AnalyzerOutput:
+            feature_id = feature["properties"]["feature_id"]
+            return AnalyzerOutput(
+                primary_cog_asset=AssetSpec(key="cog", href=f"/{feature_id}.tif")
+            )
+
+    config = _create_test_config()
+    config.analyzer["concurrency"] = 4
+
+    plan = create_publish_plan(
+        features,
+        FeatureHrefAnalyzer(),
+        config,
+        ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc)),
+    )
+
+    assert [item.analyzer_output.primary_cog_asset.href for item in plan.items] == [
+        f"/feat-{i}.tif" for i in range(8)
+    ]
+
+
+def test_create_publish_plan_item_ids_sort_in_plan_order():
+    """Test generated item and feature IDs sort in the order of the plan."""
+    features = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"name": f"Feature {i}"},
+                "geometry": {"type": "Point", "coordinates": [i, i]},
+            }
+            for i in range(50)
+        ],
+    }
+
+    config = _create_test_config()
+    analyzer = TestAnalyzer()
+    time_provider = ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc))
+
+    plan = create_publish_plan(features, analyzer, config, time_provider)
+
+    item_ids = [item.item_id for item in plan.items]
+    feature_ids = [item.feature_id for item in plan.items]
+    assert item_ids == sorted(item_ids)
+    assert feature_ids == sorted(feature_ids)
+
+
+def test_generate_pmtiles_reports_stderr_tail(tmp_path, monkeypatch):
+    """Test a failing tippecanoe reports the tail of its stderr output."""
+    fake_tippecanoe = tmp_path / "tippecanoe"
+    fake_tippecanoe.write_text(
+        "#!/bin/sh\n"
+        "i=0\n"
+        'while [ $i -lt 20000 ]; do echo "progress $i" >&2; i=$((i+1)); done\n'
+        "echo 'fatal: bad input' >&2\n"
+        "exit 1\n"
+    )
+    fake_tippecanoe.chmod(fake_tippecanoe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    features = {"type": "FeatureCollection", "features": []}
+    try:
+        _generate_pmtiles_from_features(
+            features, tmp_path / "out.pmtiles", _create_test_config()
+        )
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError as e:
+        message = str(e)
+        assert message.rstrip().endswith("fatal: bad input")
+        assert "progress 0\n" not in message
+        assert len(message) <= 64 * 1024 + len("tippecanoe failed: ")
+
+
+def test_generate_pmtiles_streams_features_on_stdin(tmp_path, monkeypatch):
+    """Test features are piped to tippecanoe instead of passed as a file."""
+    captured = tmp_path / "stdin.geojson"
+    fake_tippecanoe = tmp_path / "tippecanoe"
+    fake_tippecanoe.write_text(f'#!/bin/sh\ncat > "{captured}"\n')
+    fake_tippecanoe.chmod(fake_tippecanoe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    features = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"feature_id": "feat-1"},
+                "geometry": {"type": "Point", "coordinates": [0, 0]},
+            }
+        ],
+    }
+
+    _generate_pmtiles_from_features(
+        features, tmp_path / "out.pmtiles", _create_test_config()
+    )
+
+    assert json.loads(captured.read_text()) == features
+
+
 def _create_test_config() -> GeoExhibitConfig:
     """Create a test configuration."""
     config_data = {
@@ -1,16 +1,23 @@
 """Tests for main pipeline orchestration."""
 
 import json
+import sys
 import tempfile
+import types
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from geoexhibit.config import GeoExhibitConfig, validate_config
 from geoexhibit.pipeline import (
     create_example_features,
     ensure_feature_ids,
+    iter_ndjson_features,
     load_and_validate_features,
     load_ndjson_features,
+    load_ogr_features,
     run_geoexhibit_pipeline,
     validate_feature_collection,
 )
@@ -169,6 +176,63 @@ invalid json line
         temp_path.unlink()
 
 
+def test_load_ndjson_features_crlf_and_no_trailing_newline():
+    """Test NDJSON loading with CRLF endings and an unterminated last line."""
+    ndjson_content = (
+        b'{"type": "Feature", "properties": {"id": 1}, "geometry": null}\r\n'
+        b"   \r\n"
+        b'{"type": "Feature", "properties": {"id": 2}, "geometry": null}'
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".ndjson", delete=False) as f:
+        f.write(ndjson_content)
+        temp_path = Path(f.name)
+
+    try:
+        result = load_ndjson_features(temp_path)
+
+        assert [f["properties"]["id"] for f in result["features"]] == [1, 2]
+
+    finally:
+        temp_path.unlink()
+
+
+def test_iter_ndjson_features_yields_lazily():
+    """Test NDJSON features can be consumed one at a time."""
+    ndjson_content = (
+        b'{"type": "Feature", "properties": {"id": 1}, "geometry": null}\n'
+        b"[1, 2, 3]\n"
+        b'{"type": "Feature", "properties": {"id": 2}, "geometry": null}\n'
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".ndjson", delete=False) as f:
+        f.write(ndjson_content)
+        temp_path = Path(f.name)
+
+    try:
+        features = iter_ndjson_features(temp_path)
+
+        assert next(features)["properties"]["id"] == 1
+        assert [f["properties"]["id"] for f in features] == [2]
+
+    finally:
+        temp_path.unlink()
+
+
+def test_load_ndjson_features_empty_file():
+    """Test NDJSON loading of an empty file."""
+    with tempfile.NamedTemporaryFile(suffix=".ndjson", delete=False) as f:
+        temp_path = Path(f.name)
+
+    try:
+        result = load_ndjson_features(temp_path)
+
+        assert result == {"type": "FeatureCollection", "features": []}
+
+    finally:
+        temp_path.unlink()
+
+
 def test_load_and_validate_features_file_not_found():
     """Test error handling when features file doesn't exist."""
     try:
@@ -193,6 +257,140 @@ def test_load_and_validate_features_unsupported_format():
         temp_path.unlink()
 
 
+def test_load_and_validate_features_streams_large_geojson(tmp_path, monkeypatch):
+    """Test large GeoJSON parsed incrementally loads the same as json.load."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("geoexhibit.pipeline._LARGE_GEOJSON_BYTES", 0)
+
+    features = create_example_features()
+    # Values a GDAL round trip would change: mixed number types in one
+    # property, date-like strings and full-precision coordinates
+    features["features"][0]["properties"].update(value=1, label="2023-09-15")
+    features["features"][1]["properties"].update(value=2.5, label=7)
+    features["features"][2]["geometry"] = {
+        "type": "Point",
+        "coordinates": [138.123456789012345, -34.987654321098765],
+    }
+    features_file = tmp_path / "features.geojson"
+    features_file.write_text(json.dumps(features))
+
+    loaded = load_and_validate_features(features_file)
+
+    expected = json.loads(features_file.read_text())
+    for feature in loaded["features"]:
+        del feature["properties"]["feature_id"]
+    assert loaded == expected
+    assert type(loaded["features"][0]["properties"]["value"]) is int
+
+
+def test_load_and_validate_features_large_geojson_without_ijson(tmp_path, monkeypatch):
+    """Test large GeoJSON is read with json.load when ijson is not installed."""
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    monkeypatch.setattr("geoexhibit.pipeline._LARGE_GEOJSON_BYTES", 0)
+
+    features_file = tmp_path / "features.geojson"
+    features_file.write_text(json.dumps(create_example_features()))
+
+    loaded = load_and_validate_features(features_file)
+
+    assert len(loaded["features"]) == 3
+
+
+def test_load_and_validate_features_large_geojson_invalid_json(tmp_path, monkeypatch):
+    """Test invalid large GeoJSON raises a ValueError naming the file."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("geoexhibit.pipeline._LARGE_GEOJSON_BYTES", 0)
+
+    features_file = tmp_path / "features.geojson"
+    features_file.write_text('{"type": "FeatureCollection", "features": [')
+
+    try:
+        load_and_validate_features(features_file)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "features.geojson" in str(e)
+
+
+def test_load_ogr_features_converts_arrow_table(monkeypatch):
+    """Test an Arrow layer becomes reprojected GeoJSON Features with its properties."""
+    import shapely
+
+    wkb = [
+        shapely.to_wkb(shapely.Point(111319.49079327357, 0.0)),
+        None,
+        shapely.to_wkb(shapely.box(0.0, 0.0, 111319.49079327357, 111325.14286638486)),
+    ]
+    properties = [
+        {"name": "a", "count": 1, "area": 2.5, "active": True},
+        {"name": "b", "count": 2, "area": None, "active": False},
+        {"name": "c", "count": 3, "area": 0.5, "active": True},
+    ]
+    table = _StubArrowTable({"geom": wkb, **_columns(properties)})
+    read_arrow_calls = []
+
+    def read_arrow(path):
+        read_arrow_calls.append(path)
+        return {"geometry_name": "geom", "crs": "EPSG:3857"}, table
+
+    _install_fake_pyogrio(monkeypatch, read_arrow)
+
+    features_file = Path("layer.gpkg")
+    result = load_ogr_features(features_file)
+
+    assert read_arrow_calls == [features_file]
+    features = result["features"]
+    assert [f["properties"] for f in features] == properties
+    assert features[1]["geometry"] is None
+
+    point = features[0]["geometry"]
+    assert point["type"] == "Point"
+    assert point["coordinates"] == pytest.approx([1.0, 0.0])
+
+    polygon = features[2]["geometry"]
+    assert polygon["type"] == "Polygon"
+    lons, lats = zip(*polygon["coordinates"][0])
+    assert min(lons) == pytest.approx(0.0) and max(lons) == pytest.approx(1.0)
+    assert min(lats) == pytest.approx(0.0) and max(lats) == pytest.approx(1.0)
+
+
+def test_load_ogr_features_keeps_wgs84_geometry(monkeypatch):
+    """Test layers already in WGS84 are not reprojected."""
+    import shapely
+
+    table = _StubArrowTable(
+        {"wkb_geometry": [shapely.to_wkb(shapely.Point(138.6, -34.9))], "id": [7]}
+    )
+    _install_fake_pyogrio(monkeypatch, lambda path: ({"crs": "EPSG:4326"}, table))
+
+    with patch("rasterio.warp.transform") as mock_transform:
+        result = load_ogr_features(Path("layer.fgb"))
+
+    mock_transform.assert_not_called()
+    assert result["features"] == [
+        {
+            "type": "Feature",
+            "properties": {"id": 7},
+            "geometry": {"type": "Point", "coordinates": [138.6, -34.9]},
+        }
+    ]
+
+
+def test_load_and_validate_features_ogr_requires_pyogrio(monkeypatch):
+    """Test GeoPackage input reports the missing optional pyogrio dependency."""
+    monkeypatch.setitem(sys.modules, "pyogrio", None)
+
+    with tempfile.NamedTemporaryFile(suffix=".gpkg", delete=False) as f:
+        temp_path = Path(f.name)
+
+    try:
+        load_and_validate_features(temp_path)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "requires pyogrio" in str(e)
+    finally:
+        temp_path.unlink()
+
+
 @patch("geoexhibit.pipeline.create_publisher")
 @patch("geoexhibit.pipeline.generate_pmtiles_plan")
 def test_run_geoexhibit_pipeline_dry_run(mock_generate_pmtiles, mock_create_publisher):
@@ -256,6 +454,11 @@ def test_run_geoexhibit_pipeline_local_output(
             mock_publisher.publish_plan.assert_called_once()
             mock_publisher.verify_publication.assert_called_once()
 
+            # Only the analyzer and PMTiles output dirs may be hard-linked from
+            plan = mock_publisher.publish_plan.call_args.args[0]
+            assert len(plan.work_dirs) == 2
+            assert plan.work_dirs[1] == "/tmp"
+
         finally:
             features_file.unlink()
 
@@ -307,3 +510,47 @@ def _create_test_config() -> GeoExhibitConfig:
         },
     }
     return validate_config(config_data)
+
+
+def _install_fake_pyogrio(monkeypatch, read_arrow) -> None:
+    """Make pyogrio.raw.read_arrow resolve to read_arrow, installed or not."""
+    raw = types.ModuleType("pyogrio.raw")
+    raw.read_arrow = read_arrow
+    pyogrio = types.ModuleType("pyogrio")
+    pyogrio.raw = raw
+    monkeypatch.setitem(sys.modules, "pyogrio", pyogrio)
+    monkeypatch.setitem(sys.modules, "pyogrio.raw", raw)
+
+
+def _columns(rows):
+    """Turn a list of row dicts into a dict of column lists."""
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+
+class _StubArrowTable:
+    """The parts of a pyarrow Table that load_ogr_features reads."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.column_names = list(columns)
+
+    def column(self, name):
+        return _StubArrowColumn(self.columns[name])
+
+    def select(self, names):
+        return _StubArrowTable({name: self.columns[name] for name in names})
+
+    def to_pylist(self):
+        rows = zip(*self.columns.values())
+        return [dict(zip(self.column_names, row)) for row in rows]
+
+
+class _StubArrowColumn:
+    """The parts of a pyarrow ChunkedArray that load_ogr_features reads."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def to_numpy(self, zero_copy_only=True):
+        assert not zero_copy_only
+        return np.array(self.values, dtype=object)
@@ -192,8 +192,7 @@ def test_discover_entry_points_with_mocks():
     registry = AnalyzerRegistry()
 
     # Test the discovery logic by checking that the method exists and can be called
-    # Actual pkg_resources testing requires mocking at import time, which is complex
-    # Instead, test that the method handles exceptions gracefully
+    # against the real installed entry points
 
     assert hasattr(registry, "_discover_entry_points")
     assert callable(registry._discover_entry_points)
@@ -202,6 +201,25 @@ def test_discover_entry_points_with_mocks():
     registry._discover_entry_points()  # Should not raise exception
 
 
+@patch("geoexhibit.plugin_registry.importlib.metadata.entry_points")
+def test_discover_entry_points_loads_group(mock_entry_points):
+    """Test entry points in the analyzer group are loaded, skipping failures."""
+    registry = AnalyzerRegistry()
+
+    good = Mock()
+    good.name = "good"
+    good.load.side_effect = lambda: registry.register("good")(MockAnalyzer)
+    bad = Mock()
+    bad.name = "bad"
+    bad.load.side_effect = ImportError("missing dependency")
+    mock_entry_points.return_value = [bad, good]
+
+    registry._discover_entry_points()
+
+    mock_entry_points.assert_called_once_with(group="geoexhibit.analyzers")
+    assert registry._analyzers == {"good": MockAnalyzer}
+
+
 def test_discover_entry_points_error_handling():
     """Test entry point discovery error handling in isolation."""
     registry = AnalyzerRegistry()
@@ -61,6 +61,30 @@ def test_publish_item_feature_id_fallback():
     assert item.feature_id == "item-456"
 
 
+def test_publish_item_properties_merged_without_touching_feature():
+    """Test analyzer properties override feature properties on a merged copy."""
+    feature = {
+        "type": "Feature",
+        "properties": {"feature_id": "feat-123", "status": "raw"},
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+    }
+    analyzer_output = AnalyzerOutput(
+        primary_cog_asset=AssetSpec(key="analysis", href="/analysis.tif"),
+        extra_properties={"status": "analyzed"},
+    )
+
+    item = PublishItem(
+        item_id="item-456",
+        feature=feature,
+        timespan=TimeSpan(start=datetime(2023, 9, 15, tzinfo=timezone.utc)),
+        analyzer_output=analyzer_output,
+    )
+
+    assert item.properties == {"feature_id": "feat-123", "status": "analyzed"}
+    assert item.properties is item.properties
+    assert feature["properties"] == {"feature_id": "feat-123", "status": "raw"}
+
+
 def test_publish_plan_creation():
     """Test PublishPlan creation and basic properties."""
     items = [
@@ -123,6 +147,31 @@ def test_publish_plan_time_range():
     assert end == datetime(2023, 9, 20, tzinfo=timezone.utc)
 
 
+def test_publish_plan_time_range_uses_interval_ends():
+    """Test time range takes the latest interval end, not the latest start."""
+    interval_item = _create_test_item_with_time(
+        "item-1", datetime(2023, 9, 10, tzinfo=timezone.utc)
+    )
+    interval_item.timespan = TimeSpan(
+        start=datetime(2023, 9, 10, tzinfo=timezone.utc),
+        end=datetime(2023, 9, 30, tzinfo=timezone.utc),
+    )
+    instant_item = _create_test_item_with_time(
+        "item-2", datetime(2023, 9, 20, tzinfo=timezone.utc)
+    )
+
+    plan = PublishPlan(
+        collection_id="test-collection",
+        job_id="job-123",
+        items=[instant_item, interval_item],
+        collection_metadata={},
+    )
+
+    start, end = plan.time_range
+    assert start == datetime(2023, 9, 10, tzinfo=timezone.utc)
+    assert end == datetime(2023, 9, 30, tzinfo=timezone.utc)
+
+
 def test_publish_plan_time_range_empty():
     """Test time range fails on empty plan."""
     plan = PublishPlan(
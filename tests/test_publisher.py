@@ -1,15 +1,25 @@
 """Tests for publisher functionality."""
 
+import json
+import os
+import shutil
+import stat
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from geoexhibit.analyzer import AssetSpec, AnalyzerOutput
 from geoexhibit.config import GeoExhibitConfig, validate_config
 from geoexhibit.layout import CanonicalLayout
 from geoexhibit.publish_plan import PublishItem, PublishPlan
-from geoexhibit.publisher import LocalPublisher, S3Publisher, create_publisher
+from geoexhibit.publisher import (
+    LocalPublisher,
+    S3Publisher,
+    _fast_copy,
+    create_publisher,
+)
 from geoexhibit.timespan import TimeSpan
 
 
@@ -83,6 +93,87 @@ def test_local_publisher_publish_plan():
         assert asset_file.exists()
 
 
+def test_local_publisher_copy_assets():
+    """Test LocalPublisher copies primary and thumbnail assets, and can re-run."""
+    config = _create_test_config()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(temp_dir) / "output"
+        work_dir = Path(temp_dir) / "work"
+        work_dir.mkdir()
+
+        test_asset = work_dir / "test_cog.tif"
+        test_asset.write_text("dummy cog content")
+        test_thumb = work_dir / "thumb.png"
+        test_thumb.write_text("dummy thumbnail")
+
+        plan = _create_test_plan(str(test_asset))
+        plan.items[0].analyzer_output.additional_assets = [
+            AssetSpec(key="thumb.png", href=str(test_thumb), roles=["thumbnail"])
+        ]
+        plan.work_dirs = [str(work_dir)]
+        layout = CanonicalLayout(plan.job_id)
+
+        publisher = LocalPublisher(output_dir, config)
+        publisher._copy_assets(plan, layout)
+        publisher._copy_assets(plan, layout)
+
+        item_id = plan.items[0].item_id
+        asset_file = output_dir / layout.asset_path(item_id, "analysis.tif")
+        thumb_file = output_dir / layout.thumb_path(item_id, "thumb.png")
+        assert asset_file.read_text() == "dummy cog content"
+        assert thumb_file.read_text() == "dummy thumbnail"
+        assert os.path.samefile(test_asset, asset_file)
+
+
+def test_fast_copy_links_pipeline_files_and_republishes(tmp_path):
+    """Test pipeline work files are hard-linked, and linking again is a no-op."""
+    source = tmp_path / "work" / "cog.tif"
+    source.parent.mkdir()
+    source.write_text("dummy cog content")
+    dest = tmp_path / "out" / "analysis.tif"
+    dest.parent.mkdir()
+
+    work_dirs = [source.parent.resolve()]
+    _fast_copy(source, dest, work_dirs)
+    _fast_copy(source, dest, work_dirs)
+
+    assert os.path.samefile(source, dest)
+    assert source.read_text() == "dummy cog content"
+
+
+def test_fast_copy_copies_persistent_files(tmp_path):
+    """Test files outside the pipeline work dirs are copied with their mode bits."""
+    source = tmp_path / "data" / "cog.tif"
+    source.parent.mkdir()
+    source.write_text("dummy cog content")
+    source.chmod(0o640)
+    dest = tmp_path / "out" / "analysis.tif"
+    dest.parent.mkdir()
+    # A persistent file in a shared directory such as /tmp is still copied
+    work_dirs = [(tmp_path / "work").resolve()]
+    _fast_copy(source, dest, work_dirs)
+    _fast_copy(source, dest, work_dirs)
+
+    assert not os.path.samefile(source, dest)
+    assert dest.read_text() == "dummy cog content"
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o640
+
+
+def test_fast_copy_same_file_keeps_source(tmp_path):
+    """Test copying a file onto itself raises instead of deleting it."""
+    source = tmp_path / "data" / "cog.tif"
+    source.parent.mkdir()
+    source.write_text("dummy cog content")
+    try:
+        _fast_copy(source, source, [(tmp_path / "work").resolve()])
+        assert False, "Should have raised SameFileError"
+    except shutil.SameFileError:
+        pass
+
+    assert source.read_text() == "dummy cog content"
+
+
 def test_local_publisher_verification():
     """Test LocalPublisher verification functionality."""
     config = _create_test_config()
@@ -149,7 +240,272 @@ def test_s3_publisher_aws_region(mock_boto3):
 
     S3Publisher(config, dry_run=True)
 
-    mock_boto3.client.assert_called_once_with("s3", region_name="us-west-2")
+    mock_boto3.client.assert_called_once_with("s3", region_name="us-west-2", config=ANY)
+    client_config = mock_boto3.client.call_args.kwargs["config"]
+    assert client_config.max_pool_connections == 16 * 10
+    assert client_config.tcp_keepalive is True
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_uploads_all_assets(mock_boto3):
+    """Test S3Publisher uploads primary and additional assets for every item."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    config = _create_test_config()
+    config.aws["upload_concurrency"] = 4
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cog = Path(temp_dir) / "cog.tif"
+        cog.write_text("dummy cog content")
+        thumb = Path(temp_dir) / "thumb.png"
+        thumb.write_text("dummy thumbnail")
+
+        plan = _create_test_plan(str(cog))
+        plan.items[0].analyzer_output.additional_assets = [
+            AssetSpec(key="thumb.png", href=str(thumb), roles=["thumbnail"])
+        ]
+
+        publisher = S3Publisher(config)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            uploads = publisher._upload_assets(
+                plan, CanonicalLayout(plan.job_id), executor
+            )
+            for upload in uploads:
+                upload.result()
+
+    uploaded_keys = sorted(
+        call.kwargs["Key"] for call in mock_client.put_object.call_args_list
+    )
+    assert uploaded_keys == [
+        "jobs/test-job-456/assets/test-item-123/analysis",
+        "jobs/test-job-456/thumbs/test-item-123/thumb.png",
+    ]
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_upload_file_uses_multipart_for_large_files(mock_boto3):
+    """Test small files are put directly and large files use the transfer manager."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    publisher = S3Publisher(_create_test_config())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        small = Path(temp_dir) / "small.png"
+        small.write_bytes(b"png")
+        large = Path(temp_dir) / "large.tif"
+        with open(large, "wb") as f:
+            f.truncate(9 * 1024 * 1024)
+
+        publisher._upload_file(str(small), "small.png", "image/png")
+        publisher._upload_file(str(large), "large.tif", "image/tiff")
+
+    mock_client.put_object.assert_called_once_with(
+        Bucket="test-bucket", Key="small.png", Body=ANY, ContentType="image/png"
+    )
+    mock_client.upload_file.assert_called_once()
+    assert mock_client.upload_file.call_args.args[1:] == ("test-bucket", "large.tif")
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_skips_unchanged_files(mock_boto3):
+    """Test files whose size and SHA-256 match the S3 object are not re-uploaded."""
+    import hashlib
+
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    config = _create_test_config()
+    config.aws["skip_unchanged"] = True
+    publisher = S3Publisher(config)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asset = Path(temp_dir) / "asset.tif"
+        asset.write_bytes(b"cog bytes")
+        digest = hashlib.sha256(b"cog bytes").hexdigest()
+
+        mock_client.head_object.return_value = {
+            "ContentLength": 9,
+            "Metadata": {"geoexhibit-sha256": digest},
+        }
+        publisher._upload_file(str(asset), "asset.tif")
+        mock_client.put_object.assert_not_called()
+
+        mock_client.head_object.return_value = {
+            "ContentLength": 9,
+            "Metadata": {"geoexhibit-sha256": "stale"},
+        }
+        publisher._upload_file(str(asset), "asset.tif")
+
+    mock_client.put_object.assert_called_once()
+    assert mock_client.put_object.call_args.kwargs["Metadata"] == {
+        "geoexhibit-sha256": digest
+    }
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_checksum_algorithm(mock_boto3):
+    """Test the configured checksum algorithm is sent with every upload."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    config = _create_test_config()
+    config.aws["checksum_algorithm"] = "CRC32C"
+    publisher = S3Publisher(config)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        small = Path(temp_dir) / "small.png"
+        small.write_bytes(b"png")
+        publisher._upload_file(str(small), "small.png", "image/png")
+    publisher._upload_content(b"{}", "small.json", "application/json")
+
+    for call in mock_client.put_object.call_args_list:
+        assert call.kwargs["ChecksumAlgorithm"] == "CRC32C"
+    assert mock_client.put_object.call_count == 2
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_uploads_stac_catalog(mock_boto3):
+    """Test S3Publisher uploads the collection and every item JSON."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    layout = CanonicalLayout("test-job-456")
+    stac_data = {
+        "collection": {
+            "path": layout.collection_path,
+            "object": MagicMock(),
+            "dict": {
+                "type": "Collection",
+                "links": [{"rel": "self", "href": "/tmp/out/collection.json"}],
+            },
+        },
+        "items": [
+            {
+                "path": layout.item_path(f"item-{i}"),
+                "object": MagicMock(),
+                "dict": {"type": "Feature", "id": f"item-{i}", "links": []},
+            }
+            for i in range(3)
+        ],
+    }
+
+    publisher = S3Publisher(_create_test_config())
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        publisher._upload_stac_catalog(stac_data, executor)
+
+    uploaded_keys = sorted(
+        call.kwargs["Key"] for call in mock_client.put_object.call_args_list
+    )
+    assert uploaded_keys == [
+        "jobs/test-job-456/stac/collection.json",
+        "jobs/test-job-456/stac/items/item-0.json",
+        "jobs/test-job-456/stac/items/item-1.json",
+        "jobs/test-job-456/stac/items/item-2.json",
+    ]
+    # The collection is uploaded with fixed links, but the caller's dict
+    # keeps the links write_stac_catalog built
+    collection_body = next(
+        call.kwargs["Body"]
+        for call in mock_client.put_object.call_args_list
+        if call.kwargs["Key"].endswith("collection.json")
+    )
+    assert json.loads(collection_body)["links"][0]["href"] == "collection.json"
+    assert stac_data["collection"]["dict"]["links"][0]["href"] == (
+        "/tmp/out/collection.json"
+    )
+
+    # The dicts write_stac_catalog built are uploaded as-is
+    stac_data["collection"]["object"].to_dict.assert_not_called()
+    for item_data in stac_data["items"]:
+        item_data["object"].to_dict.assert_not_called()
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_upload_content_uses_multipart_for_large_bodies(mock_boto3):
+    """Test small content is put directly and large content goes multipart."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    publisher = S3Publisher(_create_test_config())
+    publisher._upload_content(b"{}", "small.json", "application/json")
+    publisher._upload_content(
+        b"x" * (9 * 1024 * 1024), "large.json", "application/json"
+    )
+
+    mock_client.put_object.assert_called_once_with(
+        Bucket="test-bucket", Key="small.json", Body=b"{}", ContentType=ANY
+    )
+    mock_client.upload_fileobj.assert_called_once()
+    assert mock_client.upload_fileobj.call_args.args[2] == "large.json"
+
+
+@patch("geoexhibit.publisher.write_stac_catalog")
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_skips_stac_when_asset_upload_fails(
+    mock_boto3, mock_write_stac_catalog
+):
+    """Test STAC JSON is not uploaded when an asset upload fails."""
+    mock_client = MagicMock()
+    mock_boto3.client.return_value = mock_client
+
+    publisher = S3Publisher(_create_test_config())
+
+    try:
+        publisher.publish_plan(_create_test_plan("/nonexistent/cog.tif"))
+        assert False, "Should have raised FileNotFoundError"
+    except FileNotFoundError:
+        pass
+
+    mock_write_stac_catalog.assert_called_once()
+    mock_client.put_object.assert_not_called()
+
+
+@patch("geoexhibit.publisher.boto3")
+def test_s3_publisher_verification(mock_boto3):
+    """Test S3Publisher verifies collection, items and primary COGs."""
+    from botocore.exceptions import ClientError
+
+    plan = _create_test_plan()
+    plan.items.append(
+        PublishItem(
+            item_id="test-item-789",
+            feature=plan.items[0].feature,
+            timespan=plan.items[0].timespan,
+            analyzer_output=plan.items[0].analyzer_output,
+        )
+    )
+    documents = {
+        "jobs/test-job-456/stac/collection.json": {
+            "type": "Collection",
+            "id": "test_collection",
+        },
+    }
+    for item in plan.items:
+        documents[f"jobs/test-job-456/stac/items/{item.item_id}.json"] = {
+            "type": "Feature",
+            "id": item.item_id,
+            "assets": {"analysis": {"roles": ["primary"]}},
+        }
+
+    def get_object(Bucket, Key):
+        body = MagicMock()
+        body.read.return_value = json.dumps(documents[Key]).encode("utf-8")
+        return {"Body": body}
+
+    mock_client = MagicMock()
+    mock_client.get_object.side_effect = get_object
+    mock_boto3.client.return_value = mock_client
+
+    publisher = S3Publisher(_create_test_config())
+    assert publisher.verify_publication(plan) is True
+    assert mock_client.head_object.call_count == 2
+
+    mock_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "HeadObject"
+    )
+    assert publisher.verify_publication(plan) is False
 
 
 @patch("geoexhibit.publisher.boto3")
@@ -2,8 +2,10 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pystac
+from pystac.extensions.projection import ProjectionExtension
 
 from geoexhibit.analyzer import AssetSpec, AnalyzerOutput
 from geoexhibit.config import GeoExhibitConfig, validate_config
@@ -11,6 +13,7 @@ from geoexhibit.layout import CanonicalLayout
 from geoexhibit.publish_plan import PublishItem, PublishPlan
 from geoexhibit.stac_writer import (
     HrefResolver,
+    _stac_validator,
     create_stac_collection,
     create_stac_item,
     write_stac_catalog,
@@ -69,6 +72,31 @@ def test_create_stac_collection():
     assert len(pmtiles_links) == 0  # No PMTiles path in test plan
 
 
+def test_create_stac_collection_spatial_extent_spans_all_items():
+    """Test the collection bbox covers every item geometry."""
+    plan = _create_test_plan()
+    plan.items.append(
+        PublishItem(
+            item_id="item-point",
+            feature={
+                "type": "Feature",
+                "properties": {"feature_id": "feat-point"},
+                "geometry": {"type": "Point", "coordinates": [150.5, -30.25]},
+            },
+            timespan=TimeSpan(start=datetime(2023, 9, 16, tzinfo=timezone.utc)),
+            analyzer_output=AnalyzerOutput(
+                primary_cog_asset=AssetSpec(key="analysis.tif", href="/a.tif")
+            ),
+        )
+    )
+
+    collection = create_stac_collection(
+        plan, _create_test_config(), CanonicalLayout(plan.job_id)
+    )
+
+    assert collection.extent.spatial.bboxes == [[138.6, -34.9, 150.5, -30.25]]
+
+
 def test_create_stac_item():
     """Test STAC Item creation with primary COG asset."""
     publish_item = _create_test_publish_item()
@@ -103,6 +131,81 @@ def test_create_stac_item():
     ], f"Expected ['primary'] but got {primary_asset.roles}"
 
 
+def test_create_stac_item_applies_configured_extensions():
+    """Test configured extensions are applied to collections and items."""
+    config = _create_test_config()
+    layout = CanonicalLayout("job-123")
+
+    collection = create_stac_collection(_create_test_plan(), config, layout)
+    item = create_stac_item(_create_test_publish_item(), collection, config, layout)
+
+    proj_schema = ProjectionExtension.get_schema_uri()
+    assert proj_schema in collection.stac_extensions
+    assert proj_schema in item.stac_extensions
+    assert ProjectionExtension.ext(item).epsg == 4326
+
+
+def test_create_stac_item_uses_precomputed_bbox():
+    """Test a caller-supplied bbox is used instead of re-parsing the geometry."""
+    publish_item = _create_test_publish_item()
+
+    config = _create_test_config()
+    layout = CanonicalLayout("job-123")
+
+    collection = pystac.Collection(
+        id="test_collection", description="Test", extent=_create_dummy_extent()
+    )
+
+    with patch("shapely.geometry.shape") as mock_shape:
+        item = create_stac_item(
+            publish_item, collection, config, layout, bbox=[1.0, 2.0, 3.0, 4.0]
+        )
+
+    mock_shape.assert_not_called()
+    assert item.bbox == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_create_stac_item_with_time_interval():
+    """Test STAC Item creation for an interval timespan."""
+    publish_item = _create_test_publish_item()
+    publish_item.timespan = TimeSpan(
+        start=datetime(2023, 9, 15, tzinfo=timezone.utc),
+        end=datetime(2023, 9, 20, tzinfo=timezone.utc),
+    )
+
+    config = _create_test_config()
+    layout = CanonicalLayout("job-123")
+
+    collection = pystac.Collection(
+        id="test_collection", description="Test", extent=_create_dummy_extent()
+    )
+
+    item = create_stac_item(publish_item, collection, config, layout)
+
+    assert item.datetime is None
+    assert item.properties["start_datetime"] == "2023-09-15T00:00:00Z"
+    assert item.properties["end_datetime"] == "2023-09-20T00:00:00Z"
+    assert "start_datetime" not in publish_item.properties
+
+
+def test_create_stac_item_adds_primary_role_without_mutating_spec():
+    """Test the primary role is added to a copy of the analyzer's roles."""
+    publish_item = _create_test_publish_item()
+    primary_spec = publish_item.analyzer_output.primary_cog_asset
+    primary_spec.roles = ["data"]
+
+    config = _create_test_config()
+    layout = CanonicalLayout("job-123")
+    collection = pystac.Collection(
+        id="test_collection", description="Test", extent=_create_dummy_extent()
+    )
+
+    item = create_stac_item(publish_item, collection, config, layout)
+
+    assert item.assets[primary_spec.key].roles == ["data", "primary"]
+    assert primary_spec.roles == ["data"]
+
+
 def test_create_stac_item_with_additional_assets():
     """Test STAC Item creation with additional assets."""
     analyzer_output = AnalyzerOutput(
@@ -182,6 +285,80 @@ def test_write_stac_catalog_local_mode():
         assert "/stac/" in str(collection_path)
 
 
+@patch("geoexhibit.stac_writer._validate_stac_item")
+@patch("geoexhibit.stac_writer._validate_stac_collection")
+def test_write_stac_catalog_keeps_item_order(
+    mock_validate_collection, mock_validate_item
+):
+    """Test items built and validated concurrently keep plan order."""
+    item_ids = [f"item-{i:03d}" for i in range(20)]
+    plan = PublishPlan(
+        collection_id="test_collection",
+        job_id="job-123",
+        items=[_create_test_publish_item_with_id(item_id) for item_id in item_ids],
+        collection_metadata={},
+    )
+
+    result = write_stac_catalog(plan, _create_test_config())
+
+    assert [item["object"].id for item in result["items"]] == item_ids
+    assert [item["dict"]["id"] for item in result["items"]] == item_ids
+    assert result["collection"]["dict"]["id"] == "test_collection"
+    mock_validate_collection.assert_called_once()
+    assert mock_validate_item.call_count == len(item_ids)
+
+
+@patch("geoexhibit.stac_writer._validate_stac_item")
+@patch("geoexhibit.stac_writer._validate_stac_collection")
+def test_write_stac_catalog_raises_item_validation_error(
+    mock_validate_collection, mock_validate_item
+):
+    """Test an invalid item surfaces from the concurrent validation."""
+    mock_validate_item.side_effect = ValueError("Invalid STAC Item item-456")
+
+    try:
+        write_stac_catalog(_create_test_plan(), _create_test_config())
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "item-456" in str(e)
+
+
+@patch("geoexhibit.stac_writer._validate_stac_item")
+@patch("geoexhibit.stac_writer._validate_stac_collection")
+def test_write_stac_catalog_deferred_validation(
+    mock_validate_collection, mock_validate_item
+):
+    """Test validate=False returns a callable that validates later."""
+    result = write_stac_catalog(
+        _create_test_plan(), _create_test_config(), validate=False
+    )
+
+    mock_validate_collection.assert_not_called()
+    mock_validate_item.assert_not_called()
+
+    result["validate"]()
+
+    mock_validate_collection.assert_called_once()
+    mock_validate_item.assert_called_once()
+
+
+def test_write_stac_catalog_validates_offline():
+    """Test STAC validation uses bundled schemas without fetching any over HTTP."""
+    _stac_validator.cache_clear()
+    try:
+        with patch.object(
+            pystac.stac_io.DefaultStacIO,
+            "read_text",
+            side_effect=OSError("network disabled"),
+        ) as mock_read_text:
+            result = write_stac_catalog(_create_test_plan(), _create_test_config())
+
+        mock_read_text.assert_not_called()
+        assert len(result["items"]) == 1
+    finally:
+        _stac_validator.cache_clear()
+
+
 def test_stac_item_validation():
     """Test STAC Item validation enforces primary COG asset requirements."""
     publish_item = _create_test_publish_item()
@@ -217,6 +394,82 @@ def test_stac_item_validation():
     ], f"Expected ['primary'] for TiTiler compatibility, got {primary_asset.roles}"
 
 
+@patch("pystac.validation.validate_dict")
+def test_validate_stac_item_primary_asset_checks(mock_validate_dict):
+    """Test primary asset checks for missing and duplicate primary assets."""
+    from geoexhibit.stac_writer import _validate_stac_item
+
+    config = _create_test_config()
+    item = pystac.Item(
+        id="item-456",
+        geometry=None,
+        bbox=None,
+        datetime=datetime(2023, 9, 15, tzinfo=timezone.utc),
+        properties={},
+    )
+    item.add_asset("thumb", pystac.Asset(href="thumb.png", roles=["thumbnail"]))
+
+    try:
+        _validate_stac_item(item, config)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "missing primary COG asset" in str(e)
+
+    item.add_asset("first", pystac.Asset(href="s3://b/first.tif", roles=["primary"]))
+    item.add_asset("second", pystac.Asset(href="second.tif", roles=["primary"]))
+
+    # Only the first primary asset's HREF is checked
+    _validate_stac_item(item, config)
+
+
+def test_bundled_schema_validator_reuses_validator():
+    """Test each schema is compiled once and invalid objects still raise."""
+    from geoexhibit.stac_writer import _BundledSchemaValidator
+
+    schema_uri = "https://example.com/geoexhibit-test-schema.json"
+    validator = _BundledSchemaValidator()
+    validator._schemas[schema_uri] = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": schema_uri,
+        "type": "object",
+        "required": ["id"],
+    }
+
+    validator._validate_from_uri(
+        {"id": "a"}, pystac.STACObjectType.ITEM, schema_uri, None
+    )
+    compiled = validator._compiled[schema_uri]
+    validator._validate_from_uri(
+        {"id": "b"}, pystac.STACObjectType.ITEM, schema_uri, None
+    )
+    assert validator._compiled[schema_uri] is compiled
+
+    try:
+        validator._validate_from_uri({}, pystac.STACObjectType.ITEM, schema_uri, None)
+        assert False, "Should have raised STACValidationError"
+    except pystac.STACValidationError as e:
+        assert schema_uri in str(e)
+
+
+def test_bundled_schema_validator_covers_pystac_schema_uris():
+    """Test the installed pystac's core and extension schema URIs are bundled."""
+    from pystac.extensions.raster import RasterExtension
+    from pystac.validation.schema_uri_map import DefaultSchemaUriMap
+
+    from geoexhibit.stac_writer import _bundled_schemas
+
+    schema_uri_map = DefaultSchemaUriMap()
+    stac_version = pystac.get_stac_version()
+    bundled = _bundled_schemas()
+
+    for object_type in [pystac.STACObjectType.ITEM, pystac.STACObjectType.COLLECTION]:
+        assert (
+            schema_uri_map.get_object_schema_uri(object_type, stac_version) in bundled
+        )
+    assert ProjectionExtension.get_schema_uri() in bundled
+    assert RasterExtension.get_schema_uri() in bundled
+
+
 def test_collection_item_links_have_proper_hrefs():
     """Test that STAC Collection item links have proper relative hrefs, not null."""
     plan = _create_test_plan()
@@ -300,7 +553,7 @@ def test_collection_validates_with_proper_item_links():
 
     # This should not raise - the collection should validate successfully
     try:
-        collection.validate()
+        collection.validate(validator=_stac_validator())
     except Exception as e:
         assert False, f"Collection validation failed: {e}"
 
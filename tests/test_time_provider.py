@@ -37,6 +37,39 @@ def test_constant_time_provider():
     assert spans2[0].is_instant is True
 
 
+def test_constant_time_provider_shares_result():
+    """Test ConstantTimeProvider returns one shared immutable result."""
+    provider = ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc))
+
+    first = provider.for_feature({"properties": {"id": 1}})
+    second = provider.for_feature({"properties": {"id": 2}})
+
+    assert first is second
+    assert isinstance(first, tuple)
+
+
+def test_for_features_matches_for_feature():
+    """Test batch extraction yields the per-feature results in order."""
+    from geoexhibit.declarative_time import DeclarativeTimeProvider
+
+    features = [
+        {"properties": {"date": "2023-01-01"}},
+        {"properties": {}},
+        {"properties": {"date": "2023-06-01"}},
+    ]
+
+    declarative = DeclarativeTimeProvider(
+        {"extractor": "attribute_date", "field": "properties.date"}
+    )
+    batched = [list(spans) for spans in declarative.for_features(features)]
+    assert batched == [list(declarative.for_feature(f)) for f in features]
+
+    constant = ConstantTimeProvider(datetime(2023, 9, 15, tzinfo=timezone.utc))
+    results = list(constant.for_features(features))
+    assert len(results) == 3
+    assert all(result is constant.for_feature({}) for result in results)
+
+
 def test_constant_time_provider_with_naive_datetime():
     """Test ConstantTimeProvider adds UTC timezone to naive datetime."""
     naive_dt = datetime(2023, 9, 15, 12, 0, 0)
@@ -79,6 +112,19 @@ def test_create_time_provider_constant_datetime():
     assert spans[0].start.minute == 30
 
 
+def test_create_time_provider_constant_unpadded_and_invalid_dates():
+    """Test constant dates outside the zero-padded fast path."""
+    provider = create_time_provider("constant:2023-9-5")
+    spans = list(provider.for_feature({"type": "Feature", "properties": {}}))
+    assert spans[0].start == datetime(2023, 9, 5, tzinfo=timezone.utc)
+
+    try:
+        create_time_provider("constant:2023-02-30")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Invalid constant time format" in str(e)
+
+
 def test_create_time_provider_invalid_spec():
     """Test error handling for invalid provider specs."""
     try:
@@ -116,6 +162,29 @@ def test_create_time_provider_not_callable():
         assert "is not callable" in str(e)
 
 
+def test_create_time_provider_caches_resolved_callable():
+    """Test repeated specs reuse the imported callable until cleared."""
+    from geoexhibit.time_provider import (
+        _resolve_provider_callable,
+        clear_provider_cache,
+    )
+
+    clear_provider_cache()
+    spec = "geoexhibit.declarative_time:clear_time_caches"
+
+    for _ in range(2):
+        try:
+            create_time_provider(spec)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "must return a TimeProvider instance" in str(e)
+
+    assert _resolve_provider_callable.cache_info().hits == 1
+
+    clear_provider_cache()
+    assert _resolve_provider_callable.cache_info().currsize == 0
+
+
 def test_create_time_provider_wrong_return_type():
     """Test error handling when callable returns wrong type."""
 
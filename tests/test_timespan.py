@@ -23,3 +23,18 @@ def test_timespan_interval():
     assert span.is_instant is False
     expected = "2023-09-15T12:00:00+00:00Z/2023-09-16T12:00:00+00:00Z"
     assert span.to_stac_datetime() == expected
+
+
+def test_timespan_is_immutable_and_hashable():
+    """Test TimeSpan fields cannot change, so spans can be shared and deduplicated."""
+    dt = datetime(2023, 9, 15, 12, 0, 0, tzinfo=timezone.utc)
+    span = TimeSpan(start=dt)
+
+    try:
+        span.end = dt  # type: ignore[misc]
+        assert False, "Should have raised FrozenInstanceError"
+    except AttributeError:
+        pass
+
+    assert span.end is None
+    assert len({span, TimeSpan(start=dt)}) == 1